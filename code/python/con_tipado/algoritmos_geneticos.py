@@ -1,6 +1,17 @@
+import csv
+import json
+import os
+import pickle
+import struct
+from bisect import bisect_right
+from collections import OrderedDict
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
 from enum import Enum, auto
-from random import randint, random
-from typing import Callable, Generic, Optional, TypeVar
+from itertools import accumulate, repeat
+from random import getstate, randint, random, seed, setstate
+from statistics import fmean
+from time import perf_counter
+from typing import IO, Any, Callable, Generic, Hashable, Optional, TypeVar
 
 V = TypeVar("V")
 C = TypeVar("C")
@@ -16,11 +27,307 @@ class Pueblerino(Generic[V, C]):
         return f"{{ Valor: {self.valor} Codificacion: {self.codificacion} Fitness: {self.fitness} }}"
 
 
+def evaluar_lote(
+    fitness: Callable[[V], float], valores: list[V], semilla: Optional[str]
+) -> list[float]:
+    # Se ejecuta dentro de cada trabajador; sembrar por lote (y no por proceso)
+    # hace que el resultado no dependa de qué trabajador recibió cada lote
+    if semilla is not None:
+        seed(semilla)
+    return [fitness(valor) for valor in valores]
+
+
+class EvaluadorFitness(Generic[V]):
+    """
+    Etapa de evaluación de fitness que reparte la población en lotes entre un
+    pool de hilos o procesos de concurrent.futures.
+
+    Con una semilla, cada lote siembra el módulo random con (semilla, llamada,
+    lote), así una fitness estocástica da los mismos valores sin importar el
+    número de trabajadores. En modo HILOS el módulo random es compartido y no
+    se siembra, por lo que solo es reproducible con fitness deterministas.
+    """
+
+    class Modo(Enum):
+        SERIAL = auto()
+        HILOS = auto()
+        PROCESOS = auto()
+
+    def __init__(
+        self,
+        # Funcion para calcular la aptitud de un valor, en modo PROCESOS debe
+        # poder serializarse con pickle (definida a nivel de módulo)
+        fitness: Callable[[V], float],
+        modo: Modo = Modo.SERIAL,
+        trabajadores: Optional[int] = None,
+        tamanio_lote: int = 64,
+        semilla: Optional[int] = None,
+    ) -> None:
+        if tamanio_lote <= 0:
+            raise ValueError("El tamaño de lote debe ser un entero positivo")
+
+        self.fitness = fitness
+        self.modo = modo
+        self.trabajadores = trabajadores
+        self.tamanio_lote = tamanio_lote
+        self.semilla = semilla
+        self.llamadas = 0
+        self._pool: Optional[Executor] = None
+
+    def semillas(self, num_lotes: int) -> list[Optional[str]]:
+        if self.semilla is None or self.modo == self.Modo.HILOS:
+            return [None] * num_lotes
+        return [f"{self.semilla}-{self.llamadas}-{i}" for i in range(num_lotes)]
+
+    def evaluar(self, valores: list[V]) -> list[float]:
+        lotes = [
+            valores[i : i + self.tamanio_lote]
+            for i in range(0, len(valores), self.tamanio_lote)
+        ]
+        semillas = self.semillas(len(lotes))
+        self.llamadas += 1
+
+        if self.modo == self.Modo.SERIAL:
+            # Sembrar el random global en el proceso principal alteraría la
+            # selección, cruza y muta, por eso se restaura su estado al final
+            estado = getstate()
+            resultados = list(map(evaluar_lote, repeat(self.fitness), lotes, semillas))
+            setstate(estado)
+        else:
+            if self._pool is None:
+                self._pool = (
+                    ProcessPoolExecutor(max_workers=self.trabajadores)
+                    if self.modo == self.Modo.PROCESOS
+                    else ThreadPoolExecutor(max_workers=self.trabajadores)
+                )
+            resultados = list(
+                self._pool.map(evaluar_lote, repeat(self.fitness), lotes, semillas)
+            )
+
+        return [fitness for lote in resultados for fitness in lote]
+
+    def cerrar(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+    def __enter__(self) -> "EvaluadorFitness[V]":
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.cerrar()
+
+
+class CacheFitness(Generic[C]):
+    """
+    Memoriza el fitness por codificación para no evaluar dos veces el mismo
+    genotipo. Sin tamaño es una tabla completa (adecuada para codificaciones
+    pequeñas, como las 32 de 5 bits); con tamaño expulsa la entrada usada menos
+    recientemente.
+    """
+
+    def __init__(self, tamanio: Optional[int] = None) -> None:
+        if tamanio is not None and tamanio <= 0:
+            raise ValueError("El tamaño del cache debe ser un entero positivo")
+
+        self.tamanio = tamanio
+        self.aciertos = 0
+        self.fallos = 0
+        self._valores: OrderedDict[Hashable, float] = OrderedDict()
+
+    def obtener(self, codificacion: C) -> Optional[float]:
+        fitness = self._valores.get(codificacion)  # type: ignore[call-overload]
+        if fitness is None:
+            self.fallos += 1
+            return None
+
+        self.aciertos += 1
+        if self.tamanio is not None:
+            self._valores.move_to_end(codificacion)  # type: ignore[arg-type]
+        return fitness
+
+    def guardar(self, codificacion: C, fitness: float) -> None:
+        self._valores[codificacion] = fitness  # type: ignore[index]
+        if self.tamanio is not None and len(self._valores) > self.tamanio:
+            self._valores.popitem(last=False)
+
+    def tasa_aciertos(self) -> float:
+        consultas = self.aciertos + self.fallos
+        return self.aciertos / consultas if consultas else 0.0
+
+    def __len__(self) -> int:
+        return len(self._valores)
+
+    def __str__(self) -> str:
+        return f"{{ Aciertos: {self.aciertos} Fallos: {self.fallos} Tasa: {self.tasa_aciertos():.2%} Entradas: {len(self)} }}"
+
+
+class RegistroGeneracion:
+    """
+    Estadísticas de una generación: aptitud mínima, media y máxima, diversidad
+    (proporción de codificaciones distintas) y segundos de cada etapa.
+    """
+
+    __slots__ = (
+        "generacion",
+        "minimo",
+        "media",
+        "maximo",
+        "diversidad",
+        "t_seleccion",
+        "t_cruza",
+        "t_muta",
+        "t_evaluacion",
+    )
+
+    CAMPOS = __slots__
+
+    def __init__(
+        self,
+        generacion: int,
+        poblacion: list[Pueblerino[Any, Any]],
+        tiempos: tuple[float, float, float, float],
+    ) -> None:
+        aptitudes = [p.fitness for p in poblacion]
+        self.generacion = generacion
+        self.minimo = min(aptitudes)
+        self.media = fmean(aptitudes)
+        self.maximo = max(aptitudes)
+        self.diversidad = len({p.codificacion for p in poblacion}) / len(poblacion)
+        self.t_seleccion, self.t_cruza, self.t_muta, self.t_evaluacion = tiempos
+
+    def como_dict(self) -> dict[str, float]:
+        return {campo: getattr(self, campo) for campo in self.CAMPOS}
+
+    def __str__(self) -> str:
+        return f"{{ Generacion: {self.generacion} Min: {self.minimo} Media: {self.media:.3f} Max: {self.maximo} Diversidad: {self.diversidad:.2f} }}"
+
+
+class Historial(Generic[V, C]):
+    """
+    Resultado de ejecutar_algoritmo: el mejor Pueblerino encontrado y el
+    registro de cada generación, empezando por la población inicial (0).
+    """
+
+    def __init__(self) -> None:
+        self.registros: list[RegistroGeneracion] = []
+        self.mejor: Optional[Pueblerino[V, C]] = None
+
+    def registrar(
+        self, registro: RegistroGeneracion, poblacion: list[Pueblerino[V, C]]
+    ) -> None:
+        self.registros.append(registro)
+        candidato = max(poblacion, key=lambda p: p.fitness)
+        if self.mejor is None or candidato.fitness > self.mejor.fitness:
+            self.mejor = candidato
+
+    def tiempo_total(self) -> float:
+        return sum(
+            r.t_seleccion + r.t_cruza + r.t_muta + r.t_evaluacion
+            for r in self.registros
+        )
+
+    def __len__(self) -> int:
+        return len(self.registros)
+
+
+class SalidaArchivo:
+    """
+    Destino de telemetría que escribe un RegistroGeneracion por línea, en CSV
+    o en NDJSON (un objeto JSON por línea). Se usa como 'al_registrar'.
+    """
+
+    class Formato(Enum):
+        CSV = auto()
+        NDJSON = auto()
+
+    def __init__(self, ruta: str, formato: Formato = Formato.CSV) -> None:
+        self.formato = formato
+        self._archivo: IO[str] = open(ruta, "w", newline="")
+        self._csv: Optional[Any] = None
+        if formato == self.Formato.CSV:
+            self._csv = csv.writer(self._archivo)
+            self._csv.writerow(RegistroGeneracion.CAMPOS)
+
+    def __call__(self, registro: RegistroGeneracion) -> None:
+        if self._csv is not None:
+            self._csv.writerow(
+                [getattr(registro, campo) for campo in RegistroGeneracion.CAMPOS]
+            )
+        else:
+            self._archivo.write(json.dumps(registro.como_dict()) + "\n")
+
+    def cerrar(self) -> None:
+        self._archivo.close()
+
+    def __enter__(self) -> "SalidaArchivo":
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.cerrar()
+
+
+class PuntoControl:
+    """
+    Guarda periódicamente el estado de ejecutar_algoritmo (población,
+    generación, historial y estado del módulo random) para continuar con
+    AlgoritmoGenetico.reanudar después de una interrupción. Si el algoritmo
+    tiene CacheFitness, también se guardan su tabla y sus contadores.
+
+    El archivo es una cabecera binaria fija (firma, versión, generación y
+    longitud del contenido) seguida del estado serializado con pickle. Se
+    escribe en un archivo temporal que luego reemplaza al anterior, así una
+    caída a mitad de la escritura no destruye el último punto de control.
+    """
+
+    FIRMA = b"AGPC"
+    VERSION = 1
+    CABECERA = struct.Struct("<4sHQQ")
+
+    def __init__(self, ruta: str, intervalo: int = 10) -> None:
+        if intervalo <= 0:
+            raise ValueError("El intervalo debe ser un entero positivo")
+        self.ruta = ruta
+        self.intervalo = intervalo
+
+    def toca_guardar(self, generacion: int) -> bool:
+        return generacion % self.intervalo == 0
+
+    def guardar(self, generacion: int, estado: dict[str, Any]) -> None:
+        contenido = pickle.dumps(estado, protocol=pickle.HIGHEST_PROTOCOL)
+        temporal = f"{self.ruta}.tmp"
+        with open(temporal, "wb") as archivo:
+            archivo.write(
+                self.CABECERA.pack(self.FIRMA, self.VERSION, generacion, len(contenido))
+            )
+            archivo.write(contenido)
+            archivo.flush()
+            os.fsync(archivo.fileno())
+        os.replace(temporal, self.ruta)
+
+    @classmethod
+    def cargar(cls, ruta: str) -> tuple[int, dict[str, Any]]:
+        with open(ruta, "rb") as archivo:
+            cabecera = archivo.read(cls.CABECERA.size)
+            if len(cabecera) < cls.CABECERA.size:
+                raise ValueError(f"'{ruta}' no es un punto de control completo")
+
+            firma, version, generacion, longitud = cls.CABECERA.unpack(cabecera)
+            if firma != cls.FIRMA or version != cls.VERSION:
+                raise ValueError(f"'{ruta}' no es un punto de control compatible")
+
+            contenido = archivo.read(longitud)
+            if len(contenido) < longitud:
+                raise ValueError(f"'{ruta}' no es un punto de control completo")
+        return (generacion, pickle.loads(contenido))
+
+
 class AlgoritmoGenetico(Generic[V, C]):
     class ModoSeleccion(Enum):
         ELITISMO = auto()
         RANGOS = auto()
         RULETA = auto()
+        UNIVERSAL = auto()
 
     def __init__(
         self,
@@ -30,10 +337,25 @@ class AlgoritmoGenetico(Generic[V, C]):
         muta: Callable[[list[Pueblerino[V, C]]], list[Pueblerino[V, C]]],
         # Funcion para determinar si se llegó al objetivo
         paro: Callable[[list[Pueblerino[V, C]]], bool],
+        # Funcion de aptitud; si se indica, la etapa de evaluación recalcula el
+        # fitness de cada Pueblerino después de cruza y muta
+        fitness: Optional[Callable[[V], float]] = None,
+        # Evaluador para repartir la etapa de evaluación en un pool; quien lo
+        # pasa es responsable de cerrarlo (con 'with' o cerrar())
+        evaluador: Optional[EvaluadorFitness[V]] = None,
+        # Cache de fitness por codificación para la etapa de evaluación
+        cache_fitness: Optional[CacheFitness[C]] = None,
     ) -> None:
         self.cruza = cruza
         self.muta = muta
         self.paro = paro
+        # El evaluador creado a partir de 'fitness' es del algoritmo y se
+        # cierra al terminar ejecutar_algoritmo o reanudar
+        self._evaluador_propio = evaluador is None and fitness is not None
+        if evaluador is None and fitness is not None:
+            evaluador = EvaluadorFitness(fitness)
+        self.evaluador = evaluador
+        self.cache_fitness = cache_fitness
 
     def elitismo(self, poblacion: list[Pueblerino[V, C]]) -> list[Pueblerino[V, C]]:
         nueva_poblacion: list[Pueblerino[V, C]] = []
@@ -55,89 +377,239 @@ class AlgoritmoGenetico(Generic[V, C]):
         return nueva_poblacion
 
     def rangos(self, poblacion: list[Pueblerino[V, C]]) -> list[Pueblerino[V, C]]:
-        nueva_poblacion: list[Pueblerino[V, C]] = []
         poblacion_ordenada = sorted(poblacion, key=lambda p: p.fitness)
 
-        size = len(poblacion)
+        # El peor tiene rango 1 y el mejor rango n
+        rangos = list(accumulate(range(1, len(poblacion) + 1)))
+        return self.muestrear(poblacion_ordenada, rangos)
 
-        # Formula de los primeros n numeros naturales
-        sumatoria_ranking = size * (size + 1) / 2
-
-        rangos = [0.0]
-        for i in range(size):
-            porcentaje = (i + 1) / sumatoria_ranking
-            porcentaje_acumulado = rangos[i] + porcentaje
-            redondeo = round(porcentaje_acumulado, 3)
-            rangos.append(redondeo)
+    def ruleta(self, poblacion: list[Pueblerino[V, C]]) -> list[Pueblerino[V, C]]:
+        if any(p.fitness < 0 for p in poblacion):
+            raise ValueError("La ruleta necesita valores de fitness no negativos")
 
-        for _ in range(size):
-            random_num = random()
+        aptitudes = list(accumulate(p.fitness for p in poblacion))
+        return self.muestrear(poblacion, aptitudes)
 
-            for i in range(len(rangos)):
-                if rangos[i - 1] <= random_num < rangos[i]:
-                    seleccion = poblacion_ordenada[i - 1]
-                    nueva_poblacion.append(seleccion)
-                    break
+    def universal(self, poblacion: list[Pueblerino[V, C]]) -> list[Pueblerino[V, C]]:
+        # Muestreo estocástico universal: n punteros equiespaciados sobre la
+        # ruleta con un solo número aleatorio, recorridos en una sola pasada
+        if any(p.fitness < 0 for p in poblacion):
+            raise ValueError("El muestreo universal necesita fitness no negativos")
 
-        return nueva_poblacion
+        size = len(poblacion)
+        aptitudes = list(accumulate(p.fitness for p in poblacion))
+        total = aptitudes[-1]
+        if total <= 0:
+            return [poblacion[randint(0, size - 1)] for _ in range(size)]
 
-    def ruleta(self, poblacion: list[Pueblerino[V, C]]) -> list[Pueblerino[V, C]]:
+        paso = total / size
+        puntero = random() * paso
         nueva_poblacion: list[Pueblerino[V, C]] = []
-        poblacion_ordenada = sorted(poblacion, key=lambda p: p.fitness, reverse=True)
-        aptitud_total = sum(p.fitness for p in poblacion_ordenada)
+        i = 0
+        for _ in range(size):
+            while i < size - 1 and aptitudes[i] <= puntero:
+                i += 1
+            nueva_poblacion.append(poblacion[i])
+            puntero += paso
 
-        size = len(poblacion)
-        rangos = [0.0]
+        return nueva_poblacion
 
-        for i in range(size):
-            p = poblacion_ordenada[i]
-            porcentaje = p.fitness / aptitud_total
-            porcentaje_acumulado = rangos[i] + porcentaje
-            rangos.append(round(porcentaje_acumulado, 3))
+    def muestrear(
+        self, poblacion: list[Pueblerino[V, C]], acumulado: list[float]
+    ) -> list[Pueblerino[V, C]]:
+        # Selección proporcional exacta: cada tiro se ubica con búsqueda binaria
+        # sobre los pesos acumulados, O(log n) por individuo seleccionado
+        size = len(poblacion)
+        total = acumulado[-1]
+        if total <= 0:
+            return [poblacion[randint(0, size - 1)] for _ in range(size)]
+
+        ultimo = size - 1
+        return [
+            poblacion[min(bisect_right(acumulado, random() * total), ultimo)]
+            for _ in range(size)
+        ]
+
+    def evaluar(self, poblacion: list[Pueblerino[V, C]]) -> list[Pueblerino[V, C]]:
+        if self.evaluador is None:
+            return poblacion
+
+        if self.cache_fitness is None:
+            aptitudes = self.evaluador.evaluar([p.valor for p in poblacion])
+            for pueblerino, fitness in zip(poblacion, aptitudes):
+                pueblerino.fitness = fitness
+            return poblacion
+
+        # Solo se evalúa una vez cada codificación que no esté en el cache
+        pendientes: dict[C, list[Pueblerino[V, C]]] = {}
+        for pueblerino in poblacion:
+            if pueblerino.codificacion in pendientes:
+                pendientes[pueblerino.codificacion].append(pueblerino)
+                continue
 
-        for _ in range(size):
-            random_num = random()
+            fitness = self.cache_fitness.obtener(pueblerino.codificacion)
+            if fitness is None:
+                pendientes[pueblerino.codificacion] = [pueblerino]
+            else:
+                pueblerino.fitness = fitness
+
+        grupos = list(pendientes.values())
+        aptitudes = self.evaluador.evaluar([grupo[0].valor for grupo in grupos])
+        for grupo, fitness in zip(grupos, aptitudes):
+            self.cache_fitness.guardar(grupo[0].codificacion, fitness)
+            for pueblerino in grupo:
+                pueblerino.fitness = fitness
+        return poblacion
 
-            for i in range(len(rangos)):
-                if rangos[i - 1] <= random_num < rangos[i]:
-                    seleccionado = poblacion_ordenada[i - 1]
-                    nueva_poblacion.append(seleccionado)
-                    break
+    def siguiente_generacion_medida(
+        self, poblacion: list[Pueblerino[V, C]], seleccion: ModoSeleccion
+    ) -> tuple[list[Pueblerino[V, C]], tuple[float, float, float, float]]:
+        # Igual que siguiente_generacion, pero también regresa los segundos de
+        # selección, cruza, muta y evaluación
+        seleccionMatcher = {
+            self.ModoSeleccion.ELITISMO: self.elitismo,
+            self.ModoSeleccion.RULETA: self.ruleta,
+            self.ModoSeleccion.RANGOS: self.rangos,
+            self.ModoSeleccion.UNIVERSAL: self.universal,
+        }
 
-        return nueva_poblacion
+        t0 = perf_counter()
+        poblacion = seleccionMatcher[seleccion](poblacion)
+        t1 = perf_counter()
+        poblacion = self.cruza(poblacion)
+        t2 = perf_counter()
+        poblacion = self.muta(poblacion)
+        t3 = perf_counter()
+        poblacion = self.evaluar(poblacion)
+        t4 = perf_counter()
+        return (poblacion, (t1 - t0, t2 - t1, t3 - t2, t4 - t3))
+
+    def siguiente_generacion(
+        self, poblacion: list[Pueblerino[V, C]], seleccion: ModoSeleccion
+    ) -> list[Pueblerino[V, C]]:
+        return self.siguiente_generacion_medida(poblacion, seleccion)[0]
 
     def ejecutar_algoritmo(
         self,
         poblacion: list[Pueblerino[V, C]],
         seleccion: ModoSeleccion,
         lim_generaciones: Optional[int] = None,
-    ):
-        generacion = 0
-        poblacion_cpy = poblacion.copy()
+        # Se llama con el registro de cada generación (ej. SalidaArchivo)
+        al_registrar: Optional[Callable[[RegistroGeneracion], None]] = None,
+        # Guarda el estado cada cierto número de generaciones
+        punto_control: Optional[PuntoControl] = None,
+    ) -> tuple[Pueblerino[V, C], Historial[V, C]]:
+        historial: Historial[V, C] = Historial()
+
+        try:
+            inicio = perf_counter()
+            poblacion_cpy = self.evaluar(poblacion.copy())
+            registro = RegistroGeneracion(
+                0, poblacion_cpy, (0.0, 0.0, 0.0, perf_counter() - inicio)
+            )
+            historial.registrar(registro, poblacion_cpy)
+            if al_registrar is not None:
+                al_registrar(registro)
+
+            return self.evolucionar(
+                poblacion_cpy,
+                seleccion,
+                lim_generaciones,
+                0,
+                historial,
+                al_registrar,
+                punto_control,
+            )
+        finally:
+            self.liberar_evaluador()
 
-        seleccionMatcher = {
-            self.ModoSeleccion.ELITISMO: self.elitismo,
-            self.ModoSeleccion.RULETA: self.ruleta,
-            self.ModoSeleccion.RANGOS: self.rangos,
-        }
+    def reanudar(
+        self,
+        ruta: str,
+        al_registrar: Optional[Callable[[RegistroGeneracion], None]] = None,
+        # Si no se indica, se sigue guardando en la misma ruta y con el
+        # intervalo con el que se creó el punto de control
+        punto_control: Optional[PuntoControl] = None,
+    ) -> tuple[Pueblerino[V, C], Historial[V, C]]:
+        # Las funciones de cruza, muta, paro y fitness no se guardan: se
+        # reanuda con las de este algoritmo, que deben ser las de la ejecución
+        # original para continuar exactamente donde se quedó
+        generacion, estado = PuntoControl.cargar(ruta)
+        setstate(estado["random"])
+        if self.evaluador is not None:
+            self.evaluador.llamadas = estado["llamadas_evaluador"]
+        # Sin restaurar el cache cambiarían los lotes que se evalúan (y con
+        # ellos una fitness estocástica sembrada) y sus contadores
+        cache = estado.get("cache_fitness")
+        if self.cache_fitness is not None and cache is not None:
+            self.cache_fitness.aciertos = cache.aciertos
+            self.cache_fitness.fallos = cache.fallos
+            self.cache_fitness._valores = cache._valores
+        if punto_control is None:
+            punto_control = PuntoControl(ruta, estado["intervalo"])
+
+        try:
+            return self.evolucionar(
+                estado["poblacion"],
+                self.ModoSeleccion[estado["seleccion"]],
+                estado["lim_generaciones"],
+                generacion,
+                estado["historial"],
+                al_registrar,
+                punto_control,
+            )
+        finally:
+            self.liberar_evaluador()
 
-        print(f"Poblacion inicial")
-        for p in poblacion_cpy:
-            print(p)
+    def liberar_evaluador(self) -> None:
+        # Solo se cierra el pool del evaluador que creó el propio algoritmo;
+        # si se vuelve a usar, el pool se crea de nuevo bajo demanda
+        if self._evaluador_propio and self.evaluador is not None:
+            self.evaluador.cerrar()
 
-        while not self.paro(poblacion_cpy) and (
+    def evolucionar(
+        self,
+        poblacion: list[Pueblerino[V, C]],
+        seleccion: ModoSeleccion,
+        lim_generaciones: Optional[int],
+        generacion: int,
+        historial: Historial[V, C],
+        al_registrar: Optional[Callable[[RegistroGeneracion], None]],
+        punto_control: Optional[PuntoControl],
+    ) -> tuple[Pueblerino[V, C], Historial[V, C]]:
+        # Ciclo principal de ejecutar_algoritmo y reanudar a partir de una
+        # población ya evaluada
+        while not self.paro(poblacion) and (
             lim_generaciones == None or generacion <= lim_generaciones
         ):
-            poblacion_cpy = seleccionMatcher[seleccion](poblacion_cpy)
-            poblacion_cpy = self.cruza(poblacion_cpy)
-            poblacion_cpy = self.muta(poblacion_cpy)
-
-            print(f"Generacion {generacion}")
-            for p in poblacion_cpy:
-                print(p)
-
+            poblacion, tiempos = self.siguiente_generacion_medida(poblacion, seleccion)
             generacion += 1
 
+            registro = RegistroGeneracion(generacion, poblacion, tiempos)
+            historial.registrar(registro, poblacion)
+            if al_registrar is not None:
+                al_registrar(registro)
+
+            if punto_control is not None and punto_control.toca_guardar(generacion):
+                punto_control.guardar(
+                    generacion,
+                    {
+                        "poblacion": poblacion,
+                        "seleccion": seleccion.name,
+                        "lim_generaciones": lim_generaciones,
+                        "intervalo": punto_control.intervalo,
+                        "historial": historial,
+                        "random": getstate(),
+                        "llamadas_evaluador": (
+                            self.evaluador.llamadas if self.evaluador is not None else 0
+                        ),
+                        "cache_fitness": self.cache_fitness,
+                    },
+                )
+
+        assert historial.mejor is not None
+        return (historial.mejor, historial)
+
 
 if __name__ == "__main__":
 
@@ -158,8 +630,8 @@ if __name__ == "__main__":
             max_num_binario_posible = 2**bits - 1
             codificacion = format(randint(0, max_num_binario_posible), f"0{bits}b")
             valor = int(codificacion, 2)
-            fitness = calcular_fitness(valor)
-            poblacion.append(Pueblerino(valor, codificacion, fitness))
+            # El fitness se calcula en la etapa de evaluación del algoritmo
+            poblacion.append(Pueblerino(valor, codificacion, 0.0))
 
         return poblacion
 
@@ -186,7 +658,7 @@ if __name__ == "__main__":
             nuevo_pueblerino = Pueblerino(
                 codificacion=codificacion,
                 valor=valor,
-                fitness=calcular_fitness(valor),
+                fitness=0.0,
             )
             nueva_poblacion.append(nuevo_pueblerino)
         return nueva_poblacion
@@ -218,11 +690,11 @@ if __name__ == "__main__":
 
             valor = int(codificacion_hijo1, 2)
             codificacion = codificacion_hijo1
-            fitness = calcular_fitness(valor)
+            fitness = 0.0
             hijo1 = Pueblerino(valor, codificacion, fitness)
             valor = int(codificacion_hijo2, 2)
             codificacion = codificacion_hijo2
-            fitness = calcular_fitness(valor)
+            fitness = 0.0
             hijo2 = Pueblerino(
                 valor=valor,
                 codificacion=codificacion,
@@ -248,7 +720,7 @@ if __name__ == "__main__":
             )
             valor = int(codificacion_hijo, 2)
             codificacion = codificacion_hijo
-            fitness = calcular_fitness(valor)
+            fitness = 0.0
             hijo = Pueblerino(
                 valor=valor,
                 codificacion=codificacion,
@@ -264,10 +736,23 @@ if __name__ == "__main__":
                 return True
         return False
 
-    algoritmo = AlgoritmoGenetico(cruza=cruza, paro=paro, muta=muta)
+    algoritmo = AlgoritmoGenetico(
+        cruza=cruza,
+        paro=paro,
+        muta=muta,
+        fitness=calcular_fitness,
+        # 5 bits: solo hay 32 codificaciones posibles, cabe la tabla completa
+        cache_fitness=CacheFitness(),
+    )
     poblacion = generar_poblacion_binaria_aleatoria(num_pueblerinos=10, bits=5)
-    algoritmo.ejecutar_algoritmo(
+    mejor, historial = algoritmo.ejecutar_algoritmo(
         poblacion=poblacion,
         seleccion=AlgoritmoGenetico.ModoSeleccion.ELITISMO,
         lim_generaciones=30,
+        al_registrar=print,
+    )
+    print(f"Mejor: {mejor}")
+    print(
+        f"Generaciones: {len(historial) - 1} Tiempo: {historial.tiempo_total():.6f} s"
     )
+    print(f"Cache de fitness: {algoritmo.cache_fitness}")
@@ -0,0 +1,217 @@
+from typing import Callable, Optional
+
+import numpy as np
+
+from algoritmos_geneticos import AlgoritmoGenetico
+
+ModoSeleccion = AlgoritmoGenetico.ModoSeleccion
+
+
+class PoblacionBinaria:
+    """
+    Población completa como matriz de bits: una fila por individuo, una columna
+    por alelo (uint8 con valores 0/1) y un vector con la aptitud de cada fila.
+    """
+
+    def __init__(self, genes: np.ndarray, fitness: np.ndarray) -> None:
+        if genes.ndim != 2 or genes.shape[0] != fitness.shape[0]:
+            raise ValueError("'genes' debe ser una matriz con una fila por fitness")
+        self.genes = genes
+        self.fitness = fitness
+
+    def __len__(self) -> int:
+        return self.genes.shape[0]
+
+    def mejor(self) -> tuple[np.ndarray, float]:
+        indice = int(np.argmax(self.fitness))
+        return (self.genes[indice], float(self.fitness[indice]))
+
+    def empaquetar(self) -> np.ndarray:
+        # 8 alelos por byte, útil para guardar o comparar poblaciones grandes
+        return np.packbits(self.genes, axis=1)
+
+
+def decodificar(genes: np.ndarray) -> np.ndarray:
+    # Interpreta cada fila como un entero sin signo (bit más significativo primero)
+    bits = genes.shape[-1]
+    if bits > 63:
+        raise ValueError("Solo se pueden decodificar cromosomas de hasta 63 bits")
+    potencias = np.left_shift(np.int64(1), np.arange(bits - 1, -1, -1, dtype=np.int64))
+    return genes.astype(np.int64) @ potencias
+
+
+class AlgoritmoGeneticoVectorizado:
+    """
+    Algoritmo genético donde selección, cruza y muta son operaciones sobre toda
+    la matriz de población en lugar de un ciclo por Pueblerino.
+    """
+
+    def __init__(
+        self,
+        # Recibe la matriz de genes (n, bits) y regresa el vector de fitness (n,)
+        fitness: Callable[[np.ndarray], np.ndarray],
+        # Recibe la población evaluada y determina si se llegó al objetivo
+        paro: Callable[[PoblacionBinaria], bool],
+        probabilidad_muta: float = 0.01,
+        puntos_cruza: int = 1,
+        semilla: Optional[int] = None,
+    ) -> None:
+        if probabilidad_muta > 1 or probabilidad_muta < 0:
+            raise ValueError("La probabilidad de muta debe estar entre 0 y 1")
+        if puntos_cruza < 1:
+            raise ValueError("Se necesita al menos un punto de cruza")
+
+        self.fitness = fitness
+        self.paro = paro
+        self.probabilidad_muta = probabilidad_muta
+        self.puntos_cruza = puntos_cruza
+        self.rng = np.random.default_rng(semilla)
+
+    def poblacion_aleatoria(self, num_pueblerinos: int, bits: int) -> PoblacionBinaria:
+        if bits <= 0 or num_pueblerinos <= 0:
+            error = f"Los valores deben ser enteros positivos, se recibió {num_pueblerinos} y {bits}"
+            raise ValueError(error)
+
+        genes = self.rng.integers(0, 2, size=(num_pueblerinos, bits), dtype=np.uint8)
+        return PoblacionBinaria(genes, self.fitness(genes))
+
+    def elitismo(self, poblacion: PoblacionBinaria) -> np.ndarray:
+        # El mejor pasa directo, el resto sale de torneos binarios
+        n = len(poblacion)
+        if n == 1:
+            return np.array([np.argmax(poblacion.fitness)])
+        ind1 = self.rng.integers(0, n, size=n - 1)
+        ind2 = (ind1 + self.rng.integers(1, n, size=n - 1)) % n
+        ganadores = np.where(
+            poblacion.fitness[ind1] > poblacion.fitness[ind2], ind1, ind2
+        )
+        return np.concatenate(([np.argmax(poblacion.fitness)], ganadores))
+
+    def ruleta(self, poblacion: PoblacionBinaria) -> np.ndarray:
+        if np.any(poblacion.fitness < 0):
+            raise ValueError("La ruleta necesita valores de fitness no negativos")
+        acumulado = np.cumsum(poblacion.fitness, dtype=np.float64)
+        return self._muestrear(acumulado, len(poblacion))
+
+    def rangos(self, poblacion: PoblacionBinaria) -> np.ndarray:
+        # El peor tiene rango 1 y el mejor rango n
+        orden = np.argsort(poblacion.fitness, kind="stable")
+        acumulado = np.cumsum(np.arange(1, len(poblacion) + 1, dtype=np.float64))
+        return orden[self._muestrear(acumulado, len(poblacion))]
+
+    def universal(self, poblacion: PoblacionBinaria) -> np.ndarray:
+        # Muestreo estocástico universal: n punteros equiespaciados
+        if np.any(poblacion.fitness < 0):
+            raise ValueError("El muestreo universal necesita fitness no negativos")
+        n = len(poblacion)
+        acumulado = np.cumsum(poblacion.fitness, dtype=np.float64)
+        total = acumulado[-1]
+        if total <= 0:
+            return self.rng.integers(0, n, size=n)
+        punteros = (self.rng.random() + np.arange(n)) * (total / n)
+        return np.minimum(np.searchsorted(acumulado, punteros, side="right"), n - 1)
+
+    def _muestrear(self, acumulado: np.ndarray, n: int) -> np.ndarray:
+        total = acumulado[-1]
+        if total <= 0:
+            return self.rng.integers(0, len(acumulado), size=n)
+        tiros = self.rng.random(n) * total
+        indices = np.searchsorted(acumulado, tiros, side="right")
+        return np.minimum(indices, len(acumulado) - 1)
+
+    def cruza(self, genes: np.ndarray) -> np.ndarray:
+        n, bits = genes.shape
+        if bits < 2:
+            return genes.copy()
+
+        parejas = (n + 1) // 2
+        padres1 = self.rng.integers(0, n, size=parejas)
+        padres2 = (padres1 + self.rng.integers(1, max(n, 2), size=parejas)) % n
+
+        # Cada punto de cruza invierte el padre del que se toman los alelos a
+        # partir de esa columna: la máscara es el XOR de (columna >= punto)
+        puntos = self.rng.integers(
+            1, bits, size=(parejas, self.puntos_cruza), dtype=np.uint16
+        )
+        columnas = np.arange(bits, dtype=np.uint16)
+        mascara = columnas >= puntos[:, :1]
+        for k in range(1, self.puntos_cruza):
+            mascara ^= columnas >= puntos[:, k : k + 1]
+
+        g1 = np.take(genes, padres1, axis=0)
+        g2 = np.take(genes, padres2, axis=0)
+        diferencia = g1 ^ g2
+        diferencia &= mascara.view(np.uint8)
+        hijos = np.empty((2 * parejas, bits), dtype=genes.dtype)
+        np.bitwise_xor(g1, diferencia, out=hijos[:parejas])
+        np.bitwise_xor(g2, diferencia, out=hijos[parejas:])
+        return hijos[:n]
+
+    def muta(self, genes: np.ndarray) -> np.ndarray:
+        # Se sortea cuántos alelos cambian y solo esas posiciones se invierten
+        total = genes.size
+        num_mutaciones = self.rng.binomial(total, self.probabilidad_muta)
+        if num_mutaciones:
+            posiciones = self.rng.integers(0, total, size=num_mutaciones)
+            # unravel_index escribe sobre 'genes' aunque no sea contiguo;
+            # reshape(-1) regresaría una copia en ese caso
+            genes[np.unravel_index(posiciones, genes.shape)] ^= 1
+        return genes
+
+    def siguiente_generacion(
+        self, poblacion: PoblacionBinaria, seleccion: ModoSeleccion
+    ) -> PoblacionBinaria:
+        seleccionMatcher = {
+            ModoSeleccion.ELITISMO: self.elitismo,
+            ModoSeleccion.RULETA: self.ruleta,
+            ModoSeleccion.RANGOS: self.rangos,
+            ModoSeleccion.UNIVERSAL: self.universal,
+        }
+        seleccionados = seleccionMatcher[seleccion](poblacion)
+        genes = self.cruza(poblacion.genes[seleccionados])
+        genes = self.muta(genes)
+        return PoblacionBinaria(genes, self.fitness(genes))
+
+    def ejecutar_algoritmo(
+        self,
+        poblacion: PoblacionBinaria,
+        seleccion: ModoSeleccion,
+        lim_generaciones: Optional[int] = None,
+    ) -> tuple[PoblacionBinaria, int]:
+        generacion = 0
+        while not self.paro(poblacion) and (
+            # Misma cota que AlgoritmoGenetico.ejecutar_algoritmo
+            lim_generaciones is None
+            or generacion <= lim_generaciones
+        ):
+            poblacion = self.siguiente_generacion(poblacion, seleccion)
+            generacion += 1
+        return (poblacion, generacion)
+
+
+if __name__ == "__main__":
+    from time import perf_counter
+
+    # Problema OneMax: maximizar el número de unos del cromosoma
+    bits = 256
+    algoritmo = AlgoritmoGeneticoVectorizado(
+        fitness=lambda genes: genes.sum(axis=1, dtype=np.int64).astype(np.float64),
+        paro=lambda poblacion: poblacion.fitness.max() == bits,
+        probabilidad_muta=1 / (bits * 10),
+        puntos_cruza=2,
+        semilla=0,
+    )
+    poblacion = algoritmo.poblacion_aleatoria(num_pueblerinos=100_000, bits=bits)
+
+    for seleccion in ModoSeleccion:
+        inicio = perf_counter()
+        siguiente = algoritmo.siguiente_generacion(poblacion, seleccion)
+        tiempo = (perf_counter() - inicio) * 1000
+        _, mejor = siguiente.mejor()
+        print(f"{seleccion.name}: {tiempo:.1f} ms por generación, mejor {mejor}")
+
+    poblacion = algoritmo.poblacion_aleatoria(num_pueblerinos=1_000, bits=bits)
+    poblacion, generaciones = algoritmo.ejecutar_algoritmo(
+        poblacion, ModoSeleccion.ELITISMO, lim_generaciones=500
+    )
+    print(f"Generaciones: {generaciones} Mejor: {poblacion.mejor()[1]}")
@@ -0,0 +1,363 @@
+import sys
+import tracemalloc
+from random import randint, random, seed
+from time import perf_counter
+from typing import Any, Callable, Optional
+
+from algoritmos_geneticos import AlgoritmoGenetico, Pueblerino
+from containers import ArrayQueue, ArrayStack, Container, Queue, Stack
+from cromosomas import CromosomaBits, CruzaBits, MutaBits, poblacion_bits_aleatoria
+from csr import CSRGraph
+from graph import Graph, WeightedGraph
+from nodes import DoubleLinkedNode, NonWeightedVertex, WeightedVertex
+
+
+def medir(funcion: Callable[[], Any]) -> tuple[float, Any]:
+    """
+    Ejecuta una función y mide su tiempo de pared.
+
+    Args:
+        funcion: Función sin argumentos a ejecutar
+
+    Returns:
+        Tupla (segundos transcurridos, valor retornado)
+    """
+    inicio = perf_counter()
+    resultado = funcion()
+    return (perf_counter() - inicio, resultado)
+
+
+def sin_accion(_v: Any, _arg: Optional[Any]) -> tuple[bool, Optional[Any]]:
+    return (False, None)
+
+
+def bench_csr(num_vertices: int = 200_000, num_aristas: int = 1_000_000) -> None:
+    """
+    Compara memoria por arista y tiempo de BFS entre WeightedGraph y CSRGraph.
+
+    Args:
+        num_vertices: Número de vértices del grafo sintético
+        num_aristas: Número de aristas aleatorias del grafo sintético
+    """
+    print(f"== CSR: {num_vertices} vértices, {num_aristas} aristas ==")
+    seed(0)
+    vertices = [WeightedVertex(i) for i in range(num_vertices)]
+
+    tracemalloc.start()
+    antes, _ = tracemalloc.get_traced_memory()
+    for _ in range(num_aristas):
+        origen = vertices[randint(0, num_vertices - 1)]
+        destino = vertices[randint(0, num_vertices - 1)]
+        origen.append((destino, random()))
+    bytes_objetos = tracemalloc.get_traced_memory()[0] - antes
+    grafo = WeightedGraph("sintetico", list(vertices))
+
+    antes, _ = tracemalloc.get_traced_memory()
+    csr = CSRGraph.from_graph(grafo)
+    bytes_csr = tracemalloc.get_traced_memory()[0] - antes
+    tracemalloc.stop()
+
+    print(f"Memoria por arista (objetos): {bytes_objetos / num_aristas:.1f} B")
+    print(f"Memoria por arista (CSR):     {bytes_csr / num_aristas:.1f} B")
+
+    t_objetos, _ = medir(
+        lambda: grafo.explore(vertices[0], Graph.Algorithm.BFS, action=sin_accion)
+    )
+    t_csr, _ = medir(lambda: csr.explore(0, Graph.Algorithm.BFS, action=sin_accion))
+    print(f"BFS (objetos): {t_objetos:.3f} s")
+    print(f"BFS (CSR):     {t_csr:.3f} s")
+    print()
+
+
+def bench_containers(max_exponente: int = 7) -> None:
+    """
+    Compara Queue/Stack enlazadas contra ArrayQueue/ArrayStack.
+
+    Para cada n en 10^3..10^max_exponente agrega n elementos y luego los extrae.
+
+    Args:
+        max_exponente: Exponente del mayor número de operaciones
+    """
+    print("== Contenedores: n add + n get ==")
+    fabricas: list[tuple[str, Callable[[], Container[int]]]] = [
+        ("Queue", Queue),
+        ("ArrayQueue", ArrayQueue),
+        ("Stack", Stack),
+        ("ArrayStack", ArrayStack),
+    ]
+    for exponente in range(3, max_exponente + 1):
+        n = 10**exponente
+        for nombre, fabrica in fabricas:
+
+            def operaciones() -> None:
+                contenedor = fabrica()
+                for i in range(n):
+                    contenedor.add(i)
+                while not contenedor.is_empty():
+                    contenedor.get()
+
+            tiempo, _ = medir(operaciones)
+            print(f"n=10^{exponente} {nombre:<10} {tiempo:.4f} s")
+    print()
+
+
+def bench_nodes(n: int = 100_000) -> None:
+    """
+    Reporta la memoria por instancia de los nodos y vértices usando tracemalloc.
+
+    Args:
+        n: Número de instancias a crear por clase
+    """
+    print(f"== Memoria por instancia ({n} instancias) ==")
+    fabricas: list[tuple[str, Callable[[int], Any]]] = [
+        ("DoubleLinkedNode", lambda i: DoubleLinkedNode(i)),
+        ("NonWeightedVertex", lambda i: NonWeightedVertex(i)),
+        ("WeightedVertex", lambda i: WeightedVertex(i)),
+    ]
+    for nombre, fabrica in fabricas:
+        tracemalloc.start()
+        instancias = [fabrica(i) for i in range(n)]
+        actual, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(f"{nombre:<18} {actual / n:.1f} B")
+        del instancias
+    print()
+
+
+def bench_seleccion(max_exponente: int = 6) -> None:
+    """
+    Mide ruleta, rangos y muestreo universal para poblaciones de 10^3 a 10^max_exponente.
+
+    Args:
+        max_exponente: Exponente del mayor tamaño de población
+    """
+    print("== Selección: una generación completa ==")
+    algoritmo: AlgoritmoGenetico[int, str] = AlgoritmoGenetico(
+        cruza=lambda p: p, muta=lambda p: p, paro=lambda _p: True
+    )
+    for exponente in range(3, max_exponente + 1):
+        n = 10**exponente
+        poblacion = [Pueblerino(i, format(i, "b"), random()) for i in range(n)]
+        for nombre, seleccion in (
+            ("ruleta", algoritmo.ruleta),
+            ("rangos", algoritmo.rangos),
+            ("universal", algoritmo.universal),
+        ):
+            tiempo, _ = medir(lambda: seleccion(poblacion))
+            print(f"n=10^{exponente} {nombre:<10} {tiempo:.4f} s")
+    print()
+
+
+def bench_cromosomas(num_pueblerinos: int = 2_000, generaciones: int = 20) -> None:
+    """
+    Compara cruza y muta con codificación de cadena '0'/'1' contra CromosomaBits
+    para cromosomas de 8, 64 y 1024 bits.
+
+    Args:
+        num_pueblerinos: Tamaño de la población
+        generaciones: Veces que se aplican cruza y muta
+    """
+    print(f"== Cromosomas: {generaciones} x (cruza + muta), n={num_pueblerinos} ==")
+
+    # Mismos operadores que el ejemplo de algoritmos_geneticos.py
+    def cruza_cadena(poblacion: list[Pueblerino]) -> list[Pueblerino]:
+        nueva_poblacion = []
+        longitud = len(poblacion[0].codificacion)
+        for _ in range(len(poblacion) // 2):
+            padre1 = poblacion[randint(0, len(poblacion) - 1)]
+            padre2 = poblacion[randint(0, len(poblacion) - 1)]
+            punto = randint(1, longitud - 1)
+            for codificacion in (
+                padre1.codificacion[:punto] + padre2.codificacion[punto:],
+                padre2.codificacion[:punto] + padre1.codificacion[punto:],
+            ):
+                nueva_poblacion.append(
+                    Pueblerino(int(codificacion, 2), codificacion, 0.0)
+                )
+        return nueva_poblacion
+
+    def muta_cadena(poblacion: list[Pueblerino]) -> list[Pueblerino]:
+        nueva_poblacion = []
+        for pueblerino in poblacion:
+            codificacion_arr = list(pueblerino.codificacion)
+            if random() <= 0.1:
+                alelo = randint(0, len(codificacion_arr) - 1)
+                codificacion_arr[alelo] = "1" if codificacion_arr[alelo] == "0" else "0"
+            codificacion = "".join(codificacion_arr)
+            nueva_poblacion.append(Pueblerino(int(codificacion, 2), codificacion, 0.0))
+        return nueva_poblacion
+
+    cruza_bits: CruzaBits[int] = CruzaBits()
+    muta_bits: MutaBits[int] = MutaBits(probabilidad_muta=0.1)
+    for bits in (8, 64, 1024):
+        seed(0)
+        cromosomas = [CromosomaBits.aleatorio(bits) for _ in range(num_pueblerinos)]
+        cadenas = [Pueblerino(int(c), str(c), 0.0) for c in cromosomas]
+        enteros = [Pueblerino(int(c), c, 0.0) for c in cromosomas]
+
+        for nombre, cruza, muta, poblacion in (
+            ("cadena", cruza_cadena, muta_cadena, cadenas),
+            ("bits", cruza_bits, muta_bits, enteros),
+        ):
+
+            def evolucionar() -> None:
+                actual = poblacion
+                for _ in range(generaciones):
+                    actual = muta(cruza(actual))
+
+            tiempo, _ = medir(evolucionar)
+            print(f"{bits:>5} bits {nombre:<7} {tiempo:.4f} s")
+    print()
+
+
+def bench_perceptron(muestras: int = 100_000, caracteristicas: int = 16) -> None:
+    """
+    Compara evaluar_neurona_perceptron llamada por muestra contra
+    evaluar_lote_perceptron sobre la matriz completa y por bloques.
+
+    Args:
+        muestras: Número de entradas a evaluar
+        caracteristicas: Número de valores por entrada
+    """
+    # Import local: el resto de los benchmarks no necesita NumPy
+    import numpy as np
+
+    from AF12_RSRO220228 import evaluar_neurona_perceptron
+    from perceptron_vectorizado import evaluar_lote_perceptron
+
+    print(f"== Perceptrón: {muestras} entradas de {caracteristicas} valores ==")
+    rng = np.random.default_rng(0)
+    matriz = rng.standard_normal((muestras, caracteristicas))
+    pesos = rng.standard_normal(caracteristicas)
+    umbral = 0.1
+    entradas = matriz.tolist()
+    lista_pesos = pesos.tolist()
+    f = lambda x: 1 if x > 0 else -1
+
+    t_escalar, escalares = medir(
+        lambda: [
+            evaluar_neurona_perceptron(entrada, lista_pesos, umbral, f)
+            for entrada in entradas
+        ]
+    )
+    t_lote, lote = medir(lambda: evaluar_lote_perceptron(matriz, pesos, umbral))
+    t_bloques, bloques = medir(
+        lambda: evaluar_lote_perceptron(
+            (matriz[i : i + 8192] for i in range(0, muestras, 8192)), pesos, umbral
+        )
+    )
+    assert np.array_equal(lote, bloques)
+    # Puede haber diferencias de redondeo en netas muy cercanas a 0
+    iguales = np.mean(lote == np.array(escalares))
+    print(f"Escalar:  {t_escalar:.4f} s")
+    print(f"Lote:     {t_lote:.4f} s")
+    print(f"Bloques:  {t_bloques:.4f} s")
+    print(f"Coincidencias: {iguales:.4%}")
+    print()
+
+
+def bench_dijkstra(lado: int = 500) -> None:
+    """
+    Mide Dijkstra en un grafo tipo red de carreteras: una cuadrícula de
+    lado x lado intersecciones con calles en ambos sentidos y pesos aleatorios
+    (unas 4 * lado^2 aristas, ~10^6 con el valor por defecto).
+
+    Args:
+        lado: Número de intersecciones por lado de la cuadrícula
+    """
+    from graph import path_from_predecessors
+
+    num_vertices = lado * lado
+    print(f"== Dijkstra: cuadrícula {lado}x{lado} ==")
+    seed(0)
+    vertices = [WeightedVertex(i) for i in range(num_vertices)]
+    for fila in range(lado):
+        for columna in range(lado):
+            v = fila * lado + columna
+            for vecino in (v + 1 if columna + 1 < lado else -1, v + lado):
+                if 0 <= vecino < num_vertices:
+                    peso = 1.0 + random()
+                    vertices[v].append((vertices[vecino], peso))
+                    vertices[vecino].append((vertices[v], peso))
+    grafo = WeightedGraph("carreteras", list(vertices))
+    csr = CSRGraph.from_graph(grafo)
+    print(f"Aristas: {len(csr.targets)}")
+
+    destino = num_vertices // 2 + lado // 2
+    t_objetos, _ = medir(lambda: grafo.dijkstra(vertices[0]))
+    t_csr, (dist, preds) = medir(lambda: csr.dijkstra(0))
+    t_par, (dist_par, preds_par) = medir(lambda: csr.dijkstra(0, destino))
+    assert dist_par[destino] == dist[destino]
+    camino = path_from_predecessors(dist_par, preds_par, destino)
+    print(f"Una fuente (objetos): {t_objetos:.3f} s")
+    print(f"Una fuente (CSR):     {t_csr:.3f} s")
+    print(f"Un par (CSR):         {t_par:.3f} s ({len(camino)} vértices)")
+    print()
+
+
+# Operadores a nivel de módulo para que los procesos de las islas los importen
+def contar_unos(valor: int) -> float:
+    return float(valor.bit_count())
+
+
+def sin_paro(_poblacion: list[Pueblerino]) -> bool:
+    return False
+
+
+def bench_islas(
+    bits: int = 2048, tamanio_poblacion: int = 400, limite: float = 30.0
+) -> None:
+    """
+    Ejecuta el modelo de islas con topología completa y migración en cada
+    generación, con cada vez más migrantes. Con la población completa como
+    migrantes el contenido supera el buffer del pipe; la ejecución debe
+    terminar en lugar de quedar bloqueada al unir los procesos.
+
+    Args:
+        bits: Longitud de cada CromosomaBits
+        tamanio_poblacion: Pueblerinos por isla
+        limite: Segundos máximos aceptables por ejecución
+    """
+    from islas import ModeloIslas
+
+    print(f"== Islas: 3 islas de {tamanio_poblacion} x {bits} bits ==")
+    algoritmo: AlgoritmoGenetico[int, CromosomaBits] = AlgoritmoGenetico(
+        cruza=CruzaBits(), muta=MutaBits(), paro=sin_paro, fitness=contar_unos
+    )
+    for num_migrantes in (2, 50, tamanio_poblacion):
+        seed(0)
+        modelo = ModeloIslas(
+            algoritmo,
+            topologia=ModeloIslas.Topologia.COMPLETA,
+            intervalo_migracion=1,
+            num_migrantes=num_migrantes,
+            semilla=0,
+        )
+        poblaciones = [
+            poblacion_bits_aleatoria(tamanio_poblacion, bits) for _ in range(3)
+        ]
+        tiempo, _ = medir(
+            lambda: modelo.ejecutar(
+                poblaciones, AlgoritmoGenetico.ModoSeleccion.ELITISMO, 3
+            )
+        )
+        print(f"{num_migrantes:>4} migrantes {tiempo:.3f} s")
+        assert tiempo < limite, f"La ejecución tardó más de {limite} s"
+    print()
+
+
+BENCHMARKS: dict[str, Callable[[], None]] = {
+    "csr": bench_csr,
+    "containers": bench_containers,
+    "nodes": bench_nodes,
+    "seleccion": bench_seleccion,
+    "cromosomas": bench_cromosomas,
+    "perceptron": bench_perceptron,
+    "dijkstra": bench_dijkstra,
+    "islas": bench_islas,
+}
+
+if __name__ == "__main__":
+    seleccion = sys.argv[1:] if len(sys.argv) > 1 else list(BENCHMARKS)
+    for nombre in seleccion:
+        BENCHMARKS[nombre]()
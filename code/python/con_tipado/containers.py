@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Generic, Optional, TypeVar
+from typing import Generic, Iterable, Optional, TypeVar, cast
 
 from nodes import DoubleLinkedNode
 
@@ -18,6 +18,8 @@ class Container(Generic[T], ABC):
         peek() -> Optional[T]: Devuelve el siguiente elemento sin eliminarlo.
         size() -> int: Devuelve el número de elementos en el contenedor.
         is_empty() -> bool: Indica si el contenedor está vacío.
+        extend(values: Iterable[T]): Agrega varios elementos en orden.
+        drain(n: Optional[int]) -> list[T]: Obtiene y elimina hasta n elementos.
     """
 
     @abstractmethod
@@ -40,6 +42,34 @@ class Container(Generic[T], ABC):
     def is_empty(self) -> bool:
         raise NotImplementedError()
 
+    def extend(self, values: Iterable[T]) -> None:
+        """
+        Agrega varios elementos, equivalente a llamar add con cada uno en orden.
+
+        Args:
+            values (Iterable[T]): Valores a agregar.
+        """
+        for value in values:
+            self.add(value)
+
+    def drain(self, n: Optional[int] = None) -> list[T]:
+        """
+        Obtiene y elimina hasta n elementos, en el mismo orden que daría get.
+
+        Args:
+            n (Optional[int]): Número máximo de elementos, None para vaciar el contenedor.
+
+        Returns:
+            list[T]: Elementos eliminados.
+        """
+        count = self.size() if n is None else min(n, self.size())
+        values: list[T] = []
+        for _ in range(count):
+            value = self.get()
+            assert value is not None
+            values.append(value)
+        return values
+
 
 class Queue(Generic[T], Container[T]):
     """
@@ -117,6 +147,52 @@ class Queue(Generic[T], Container[T]):
         self._len -= 1
         return value
 
+    def extend(self, values: Iterable[T]) -> None:
+        """
+        Agrega varios elementos al final de la cola enlazándolos en un solo paso.
+
+        Args:
+            values (Iterable[T]): Valores a agregar.
+        """
+        tail = self._tail
+        count = 0
+        for value in values:
+            new = DoubleLinkedNode(value, None, tail)
+            if tail is None:
+                self._head = new
+            else:
+                tail.next = new
+            tail = new
+            count += 1
+        self._tail = tail
+        self._len += count
+
+    def drain(self, n: Optional[int] = None) -> list[T]:
+        """
+        Elimina y devuelve hasta n elementos del inicio de la cola.
+
+        Args:
+            n (Optional[int]): Número máximo de elementos, None para vaciar la cola.
+
+        Returns:
+            list[T]: Elementos eliminados, del primero al último.
+        """
+        count = self._len if n is None else min(n, self._len)
+        values: list[T] = []
+        current = self._head
+        for _ in range(count):
+            assert current is not None
+            values.append(current.value)
+            current = current.next
+
+        self._head = current
+        if current:
+            current.prev = None
+        else:
+            self._tail = None
+        self._len -= count
+        return values
+
     def __str__(self) -> str:
         """
         Representa la cola como una cadena.
@@ -239,6 +315,48 @@ class Stack(Generic[T], Container[T]):
         """
         return self.pop()
 
+    def extend(self, values: Iterable[T]) -> None:
+        """
+        Apila varios elementos en orden; el último queda en la cima.
+
+        Args:
+            values (Iterable[T]): Valores a agregar.
+        """
+        head = self.__head
+        count = 0
+        for value in values:
+            new_node = DoubleLinkedNode(value, head)
+            if head:
+                head.prev = new_node
+            head = new_node
+            count += 1
+        self.__head = head
+        self.__len += count
+
+    def drain(self, n: Optional[int] = None) -> list[T]:
+        """
+        Desapila y devuelve hasta n elementos desde la cima.
+
+        Args:
+            n (Optional[int]): Número máximo de elementos, None para vaciar la pila.
+
+        Returns:
+            list[T]: Elementos eliminados, desde la cima hacia el fondo.
+        """
+        count = self.__len if n is None else min(n, self.__len)
+        values: list[T] = []
+        current = self.__head
+        for _ in range(count):
+            assert current is not None
+            values.append(current.value)
+            current = current.next
+
+        self.__head = current
+        if current:
+            current.prev = None
+        self.__len -= count
+        return values
+
     def __str__(self) -> str:
         """
         Representa la pila como una cadena.
@@ -252,3 +370,344 @@ class Stack(Generic[T], Container[T]):
             values.append(str(current.value))
             current = current.next
         return f"Stack[{', '.join(values)}]"
+
+
+class ArrayQueue(Generic[T], Container[T]):
+    """
+    Implementación de una cola (FIFO) sobre un buffer circular.
+
+    No reserva un nodo por elemento: los valores viven en una lista de tamaño
+    fijo que se recorre de forma circular. Si no se fija una capacidad, el buffer
+    duplica su tamaño al llenarse y lo reduce a la mitad cuando queda ocupado
+    a un cuarto o menos, por lo que todas las operaciones son O(1) amortizado.
+
+    Attributes:
+        _buffer (list[Optional[T]]): Almacenamiento circular.
+        _head (int): Índice del primer elemento.
+        _len (int): Número de elementos en la cola.
+        _capacity (Optional[int]): Capacidad máxima fija, None si puede crecer.
+    """
+
+    MIN_CAPACITY = 16
+
+    def __init__(self, capacity: Optional[int] = None) -> None:
+        """
+        Inicializa una cola vacía.
+
+        Args:
+            capacity (Optional[int]): Capacidad máxima fija, None para crecer sin límite.
+
+        Raises:
+            ValueError: Si la capacidad no es positiva.
+        """
+        if capacity is not None and capacity <= 0:
+            raise ValueError("'capacity' must be a positive integer.")
+
+        self._capacity: Optional[int] = capacity
+        initial = capacity if capacity is not None else self.MIN_CAPACITY
+        self._buffer: list[Optional[T]] = [None] * initial
+        self._head: int = 0
+        self._len: int = 0
+
+    def size(self) -> int:
+        """
+        Devuelve el número de elementos en la cola.
+
+        Returns:
+            int: Tamaño de la cola.
+        """
+        return self._len
+
+    def is_empty(self) -> bool:
+        """
+        Indica si la cola está vacía.
+
+        Returns:
+            bool: True si la cola está vacía, False en caso contrario.
+        """
+        return self._len == 0
+
+    def _resize(self, capacity: int) -> None:
+        """
+        Copia los elementos a un buffer nuevo dejando el primero en la posición 0.
+
+        Args:
+            capacity (int): Tamaño del nuevo buffer.
+        """
+        buffer = self._buffer
+        end = self._head + self._len
+        values = buffer[self._head : min(end, len(buffer))]
+        values += buffer[: max(0, end - len(buffer))]
+        self._buffer = values + [None] * (capacity - self._len)
+        self._head = 0
+
+    def enqueue(self, value: T) -> None:
+        """
+        Agrega un elemento al final de la cola.
+
+        Args:
+            value (T): Valor a agregar.
+
+        Raises:
+            OverflowError: Si la cola tiene capacidad fija y está llena.
+        """
+        if self._len == len(self._buffer):
+            if self._capacity is not None:
+                raise OverflowError("Queue is full")
+            self._resize(2 * len(self._buffer))
+
+        self._buffer[(self._head + self._len) % len(self._buffer)] = value
+        self._len += 1
+
+    def dequeue(self) -> Optional[T]:
+        """
+        Elimina y devuelve el elemento al inicio de la cola.
+
+        Returns:
+            Optional[T]: Valor eliminado, o None si la cola está vacía.
+        """
+        if self._len == 0:
+            return None
+
+        value = self._buffer[self._head]
+        self._buffer[self._head] = None
+        self._head = (self._head + 1) % len(self._buffer)
+        self._len -= 1
+
+        capacity = len(self._buffer)
+        if (
+            self._capacity is None
+            and capacity > self.MIN_CAPACITY
+            and self._len <= capacity // 4
+        ):
+            self._resize(capacity // 2)
+
+        return value
+
+    def add(self, value: T) -> None:
+        """
+        Alias de enqueue. Agrega un elemento al final de la cola.
+        """
+        self.enqueue(value)
+
+    def get(self) -> Optional[T]:
+        """
+        Alias de dequeue. Elimina y devuelve el elemento al inicio de la cola.
+        """
+        return self.dequeue()
+
+    def extend(self, values: Iterable[T]) -> None:
+        """
+        Agrega varios elementos al final de la cola copiándolos por bloques.
+
+        Args:
+            values (Iterable[T]): Valores a agregar.
+
+        Raises:
+            OverflowError: Si la cola tiene capacidad fija y no caben todos.
+        """
+        new_values = list(values)
+        required = self._len + len(new_values)
+        capacity = len(self._buffer)
+        if required > capacity:
+            if self._capacity is not None:
+                raise OverflowError("Queue is full")
+            while capacity < required:
+                capacity *= 2
+            self._resize(capacity)
+
+        start = (self._head + self._len) % capacity
+        first = min(len(new_values), capacity - start)
+        self._buffer[start : start + first] = new_values[:first]
+        self._buffer[: len(new_values) - first] = new_values[first:]
+        self._len = required
+
+    def drain(self, n: Optional[int] = None) -> list[T]:
+        """
+        Elimina y devuelve hasta n elementos del inicio de la cola.
+
+        Args:
+            n (Optional[int]): Número máximo de elementos, None para vaciar la cola.
+
+        Returns:
+            list[T]: Elementos eliminados, del primero al último.
+        """
+        count = self._len if n is None else min(n, self._len)
+        capacity = len(self._buffer)
+        end = self._head + count
+        first_end = min(end, capacity)
+        wrapped = max(0, end - capacity)
+        values = self._buffer[self._head : first_end] + self._buffer[:wrapped]
+        self._buffer[self._head : first_end] = [None] * (first_end - self._head)
+        self._buffer[:wrapped] = [None] * wrapped
+        self._head = end % capacity
+        self._len -= count
+
+        if self._capacity is None:
+            shrink = capacity
+            while shrink > self.MIN_CAPACITY and self._len <= shrink // 4:
+                shrink //= 2
+            if shrink != capacity:
+                self._resize(shrink)
+
+        return cast(list[T], values)
+
+    def peek(self) -> Optional[T]:
+        """
+        Devuelve el elemento al inicio de la cola sin eliminarlo.
+
+        Returns:
+            Optional[T]: Valor del primer elemento, o None si la cola está vacía.
+        """
+        return self._buffer[self._head] if self._len else None
+
+    def __str__(self) -> str:
+        """
+        Representa la cola como una cadena.
+
+        Returns:
+            str: Representación de los elementos de la cola.
+        """
+        capacity = len(self._buffer)
+        values = (
+            str(self._buffer[(self._head + i) % capacity]) for i in range(self._len)
+        )
+        return f"ArrayQueue[{', '.join(values)}]"
+
+
+class ArrayStack(Generic[T], Container[T]):
+    """
+    Implementación de una pila (LIFO) sobre un arreglo dinámico.
+
+    Usa una lista de Python como almacenamiento, cuyo crecimiento y reducción
+    geométricos dan push y pop en O(1) amortizado sin reservar nodos.
+
+    Attributes:
+        _values (list[T]): Elementos de la pila, la cima es el último.
+        _capacity (Optional[int]): Capacidad máxima fija, None si puede crecer.
+    """
+
+    def __init__(self, capacity: Optional[int] = None) -> None:
+        """
+        Inicializa una pila vacía.
+
+        Args:
+            capacity (Optional[int]): Capacidad máxima fija, None para crecer sin límite.
+
+        Raises:
+            ValueError: Si la capacidad no es positiva.
+        """
+        if capacity is not None and capacity <= 0:
+            raise ValueError("'capacity' must be a positive integer.")
+
+        self._capacity: Optional[int] = capacity
+        self._values: list[T] = []
+
+    def size(self) -> int:
+        """
+        Devuelve el número de elementos en la pila.
+
+        Returns:
+            int: Tamaño de la pila.
+        """
+        return len(self._values)
+
+    def is_empty(self) -> bool:
+        """
+        Indica si la pila está vacía.
+
+        Returns:
+            bool: True si la pila está vacía, False en caso contrario.
+        """
+        return not self._values
+
+    def push(self, value: T) -> None:
+        """
+        Agrega un elemento a la cima de la pila.
+
+        Args:
+            value (T): Valor a agregar.
+
+        Raises:
+            OverflowError: Si la pila tiene capacidad fija y está llena.
+        """
+        if self._capacity is not None and len(self._values) >= self._capacity:
+            raise OverflowError("Stack is full")
+        self._values.append(value)
+
+    def pop(self) -> Optional[T]:
+        """
+        Elimina y devuelve el elemento en la cima de la pila.
+
+        Returns:
+            Optional[T]: Valor eliminado, o None si la pila está vacía.
+        """
+        return self._values.pop() if self._values else None
+
+    def peek(self) -> Optional[T]:
+        """
+        Devuelve el elemento en la cima de la pila sin eliminarlo.
+
+        Returns:
+            Optional[T]: Valor del elemento superior, o None si la pila está vacía.
+        """
+        return self._values[-1] if self._values else None
+
+    def add(self, value: T) -> None:
+        """
+        Alias de push. Agrega un elemento a la cima de la pila.
+        """
+        self.push(value)
+
+    def get(self) -> Optional[T]:
+        """
+        Alias de pop. Elimina y devuelve el elemento en la cima de la pila.
+        """
+        return self.pop()
+
+    def extend(self, values: Iterable[T]) -> None:
+        """
+        Apila varios elementos en orden; el último queda en la cima.
+
+        Args:
+            values (Iterable[T]): Valores a agregar.
+
+        Raises:
+            OverflowError: Si la pila tiene capacidad fija y no caben todos.
+        """
+        if self._capacity is None:
+            self._values.extend(values)
+            return
+
+        new_values = list(values)
+        if len(self._values) + len(new_values) > self._capacity:
+            raise OverflowError("Stack is full")
+        self._values.extend(new_values)
+
+    def drain(self, n: Optional[int] = None) -> list[T]:
+        """
+        Desapila y devuelve hasta n elementos desde la cima.
+
+        Args:
+            n (Optional[int]): Número máximo de elementos, None para vaciar la pila.
+
+        Returns:
+            list[T]: Elementos eliminados, desde la cima hacia el fondo.
+        """
+        count = len(self._values) if n is None else min(n, len(self._values))
+        if count == 0:
+            return []
+        values = self._values[-count:]
+        del self._values[-count:]
+        values.reverse()
+        return values
+
+    def __str__(self) -> str:
+        """
+        Representa la pila como una cadena.
+
+        Returns:
+            str: Representación de los elementos de la pila, desde la cima.
+        """
+        values = (str(v) for v in reversed(self._values))
+        return f"ArrayStack[{', '.join(values)}]"
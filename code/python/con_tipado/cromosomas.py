@@ -0,0 +1,189 @@
+from random import getrandbits, randint, random
+from typing import Callable, Generic, TypeVar
+
+from algoritmos_geneticos import Pueblerino
+
+V = TypeVar("V")
+
+
+class CromosomaBits:
+    """
+    Cromosoma binario guardado en un entero de Python: el alelo 0 es el bit
+    más significativo, igual que el primer carácter de una codificación '0'/'1'.
+
+    Invertir un alelo es un XOR con una máscara y la cruza combina ambos padres
+    con aritmética de máscaras, sin listas ni cadenas intermedias.
+    """
+
+    __slots__ = ("bits", "longitud")
+
+    def __init__(self, bits: int, longitud: int) -> None:
+        if longitud <= 0:
+            raise ValueError("La longitud debe ser un entero positivo")
+        if bits < 0 or bits >> longitud:
+            raise ValueError(f"El valor {bits} no cabe en {longitud} bits")
+        self.bits = bits
+        self.longitud = longitud
+
+    @classmethod
+    def desde_cadena(cls, codificacion: str) -> "CromosomaBits":
+        return cls(int(codificacion, 2), len(codificacion))
+
+    @classmethod
+    def aleatorio(cls, longitud: int) -> "CromosomaBits":
+        return cls(getrandbits(longitud), longitud)
+
+    def alelo(self, posicion: int) -> int:
+        return (self.bits >> (self.longitud - 1 - posicion)) & 1
+
+    def invertir(self, posicion: int) -> "CromosomaBits":
+        return CromosomaBits(
+            self.bits ^ (1 << (self.longitud - 1 - posicion)), self.longitud
+        )
+
+    def cruzar(
+        self, otro: "CromosomaBits", punto: int
+    ) -> tuple["CromosomaBits", "CromosomaBits"]:
+        # Los alelos desde 'punto' (los bits menos significativos) se toman
+        # del otro padre: h1 = self[:punto] + otro[punto:] y viceversa
+        mascara = (1 << (self.longitud - punto)) - 1
+        diferencia = (self.bits ^ otro.bits) & mascara
+        return (
+            CromosomaBits(self.bits ^ diferencia, self.longitud),
+            CromosomaBits(otro.bits ^ diferencia, self.longitud),
+        )
+
+    def __int__(self) -> int:
+        return self.bits
+
+    def __len__(self) -> int:
+        return self.longitud
+
+    def __eq__(self, otro: object) -> bool:
+        return (
+            isinstance(otro, CromosomaBits)
+            and self.bits == otro.bits
+            and self.longitud == otro.longitud
+        )
+
+    def __hash__(self) -> int:
+        return hash((self.bits, self.longitud))
+
+    def __str__(self) -> str:
+        return format(self.bits, f"0{self.longitud}b")
+
+    def __repr__(self) -> str:
+        return f"CromosomaBits({self})"
+
+
+class CruzaBits(Generic[V]):
+    """
+    Cruza de un punto sobre Pueblerinos con codificación CromosomaBits, para
+    usarse como la función 'cruza' de AlgoritmoGenetico.
+
+    Es una clase (y no una función anidada) para poder enviarse con pickle a
+    los procesos del EvaluadorFitness o del modelo de islas.
+    """
+
+    def __init__(self, decodificar: Callable[[CromosomaBits], V] = int) -> None:
+        self.decodificar = decodificar
+
+    def hijo(self, cromosoma: CromosomaBits) -> Pueblerino[V, CromosomaBits]:
+        return Pueblerino(self.decodificar(cromosoma), cromosoma, 0.0)
+
+    def __call__(
+        self, poblacion: list[Pueblerino[V, CromosomaBits]]
+    ) -> list[Pueblerino[V, CromosomaBits]]:
+        tamanio_poblacion = len(poblacion)
+        longitud = len(poblacion[0].codificacion)
+        nueva_poblacion: list[Pueblerino[V, CromosomaBits]] = []
+
+        while len(nueva_poblacion) < tamanio_poblacion:
+            ind_padre1 = randint(0, tamanio_poblacion - 1)
+            ind_padre2 = randint(0, tamanio_poblacion - 1)
+            while tamanio_poblacion > 1 and ind_padre1 == ind_padre2:
+                ind_padre2 = randint(0, tamanio_poblacion - 1)
+
+            punto = randint(1, longitud - 1) if longitud > 1 else 0
+            hijo1, hijo2 = poblacion[ind_padre1].codificacion.cruzar(
+                poblacion[ind_padre2].codificacion, punto
+            )
+            nueva_poblacion.append(self.hijo(hijo1))
+            # Si el tamaño de la población es impar el último hijo se descarta
+            if len(nueva_poblacion) < tamanio_poblacion:
+                nueva_poblacion.append(self.hijo(hijo2))
+
+        return nueva_poblacion
+
+
+class MutaBits(Generic[V]):
+    """
+    Muta sobre Pueblerinos con codificación CromosomaBits: con la probabilidad
+    indicada invierte un alelo al azar de cada individuo.
+    """
+
+    def __init__(
+        self,
+        probabilidad_muta: float = 0.1,
+        decodificar: Callable[[CromosomaBits], V] = int,
+    ) -> None:
+        if probabilidad_muta > 1 or probabilidad_muta < 0:
+            raise ValueError("La probabilidad de muta debe estar entre 0 y 1")
+        self.probabilidad_muta = probabilidad_muta
+        self.decodificar = decodificar
+
+    def __call__(
+        self, poblacion: list[Pueblerino[V, CromosomaBits]]
+    ) -> list[Pueblerino[V, CromosomaBits]]:
+        nueva_poblacion: list[Pueblerino[V, CromosomaBits]] = []
+        for pueblerino in poblacion:
+            cromosoma = pueblerino.codificacion
+            if random() <= self.probabilidad_muta:
+                cromosoma = cromosoma.invertir(randint(0, len(cromosoma) - 1))
+                nueva_poblacion.append(
+                    Pueblerino(self.decodificar(cromosoma), cromosoma, 0.0)
+                )
+            else:
+                # Sin cambios no hace falta decodificar de nuevo
+                nueva_poblacion.append(
+                    Pueblerino(pueblerino.valor, cromosoma, pueblerino.fitness)
+                )
+        return nueva_poblacion
+
+
+def poblacion_bits_aleatoria(
+    num_pueblerinos: int,
+    bits: int,
+    decodificar: Callable[[CromosomaBits], V] = int,
+) -> list[Pueblerino[V, CromosomaBits]]:
+    if bits <= 0 or num_pueblerinos <= 0:
+        error = f"Los valores deben ser enteros positivos, se recibió {num_pueblerinos} y {bits}"
+        raise ValueError(error)
+
+    poblacion: list[Pueblerino[V, CromosomaBits]] = []
+    for _ in range(num_pueblerinos):
+        cromosoma = CromosomaBits.aleatorio(bits)
+        poblacion.append(Pueblerino(decodificar(cromosoma), cromosoma, 0.0))
+    return poblacion
+
+
+if __name__ == "__main__":
+    from algoritmos_geneticos import AlgoritmoGenetico, CacheFitness
+
+    def calcular_fitness(valor: int) -> float:
+        return valor**2
+
+    algoritmo: AlgoritmoGenetico[int, CromosomaBits] = AlgoritmoGenetico(
+        cruza=CruzaBits(),
+        muta=MutaBits(probabilidad_muta=0.1),
+        paro=lambda poblacion: any(p.fitness == 961 for p in poblacion),
+        fitness=calcular_fitness,
+        cache_fitness=CacheFitness(),
+    )
+    mejor, historial = algoritmo.ejecutar_algoritmo(
+        poblacion=poblacion_bits_aleatoria(num_pueblerinos=10, bits=5),
+        seleccion=AlgoritmoGenetico.ModoSeleccion.ELITISMO,
+        lim_generaciones=30,
+    )
+    print(f"Mejor: {mejor}")
+    print(f"Generaciones: {len(historial) - 1}")
@@ -0,0 +1,518 @@
+from array import array
+from collections import deque
+from heapq import heappop, heappush
+from random import randint
+from typing import Any, Callable, Generic, Optional, TypeVar
+
+from graph import Graph, WeightedGraph
+from nodes import Vertex
+
+T = TypeVar("T")
+Adjacency = TypeVar("Adjacency")
+
+
+class CSRGraph(Generic[T]):
+    """
+    Grafo inmutable almacenado en formato Compressed Sparse Row (CSR).
+
+    Cada vértice se identifica por un entero ``0..n-1``. Los vecinos del vértice
+    ``v`` son ``targets[offsets[v]:offsets[v + 1]]`` y, si el grafo es ponderado,
+    sus pesos son ``weights[offsets[v]:offsets[v + 1]]``. Al no existir un objeto
+    por arista ni una llamada a ``vertex_from_adjacency`` por vecino, los
+    recorridos trabajan directamente sobre arreglos compactos.
+
+    Attributes:
+        label (str): Etiqueta descriptiva del grafo
+        values (tuple[T, ...]): Valor de cada vértice, indexado por su id
+        offsets (memoryview): Inicio de las aristas de cada vértice (n + 1 elementos)
+        targets (memoryview): Vértice destino de cada arista
+        weights (Optional[memoryview]): Peso de cada arista, None si no es ponderado
+    """
+
+    __slots__ = ("label", "values", "offsets", "targets", "weights")
+
+    def __init__(
+        self,
+        label: str,
+        values: tuple[T, ...],
+        offsets: array,
+        targets: array,
+        weights: Optional[array] = None,
+    ) -> None:
+        """
+        Inicializa el grafo a partir de sus arreglos CSR.
+
+        Args:
+            label: Nombre identificativo del grafo
+            values: Valor de cada vértice
+            offsets: Arreglo de n + 1 posiciones con el inicio de cada fila
+            targets: Arreglo con el destino de cada arista
+            weights: Arreglo opcional con el peso de cada arista
+
+        Raises:
+            ValueError: Si las longitudes de los arreglos no son consistentes
+        """
+        if len(offsets) != len(values) + 1:
+            raise ValueError("'offsets' must have len(values) + 1 elements.")
+        if offsets[-1] != len(targets):
+            raise ValueError("'offsets' does not match the number of 'targets'.")
+        if weights is not None and len(weights) != len(targets):
+            raise ValueError("'weights' and 'targets' must have the same length.")
+
+        object.__setattr__(self, "label", label)
+        object.__setattr__(self, "values", tuple(values))
+        object.__setattr__(self, "offsets", memoryview(offsets).toreadonly())
+        object.__setattr__(self, "targets", memoryview(targets).toreadonly())
+        object.__setattr__(
+            self,
+            "weights",
+            memoryview(weights).toreadonly() if weights is not None else None,
+        )
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    @classmethod
+    def from_graph(cls, graph: Graph[T, Adjacency]) -> "CSRGraph[T]":
+        """
+        Construye un grafo CSR a partir de un grafo basado en objetos.
+
+        Los ids se asignan en el orden de ``graph.vertexs``; los vértices que solo
+        aparecen como adyacencia reciben los ids siguientes en orden de aparición.
+        Las adyacencias se obtienen con ``graph.adjacencies_of``, por lo que en un
+        ImplicitGraph se materializan todos los estados alcanzables desde los
+        vértices de ``graph.vertexs``.
+
+        Args:
+            graph: Grafo (NonWeightedGraph o WeightedGraph) a compactar
+
+        Returns:
+            Grafo CSR equivalente
+        """
+        weighted = isinstance(graph, WeightedGraph)
+        ids: dict[int, int] = {}
+        vertexs: list[Vertex[T, Adjacency]] = []
+
+        def id_of(vertex: Vertex[T, Adjacency]) -> int:
+            key = id(vertex)
+            vertex_id = ids.get(key)
+            if vertex_id is None:
+                vertex_id = len(vertexs)
+                ids[key] = vertex_id
+                vertexs.append(vertex)
+            return vertex_id
+
+        for vertex in graph.vertexs:
+            id_of(vertex)
+
+        offsets = array("q", [0])
+        targets = array("i")
+        weights = array("d") if weighted else None
+
+        # La lista crece mientras se recorre si aparecen vértices nuevos
+        i = 0
+        while i < len(vertexs):
+            for adjacency in graph.adjacencies_of(vertexs[i]):
+                targets.append(id_of(graph.vertex_from_adjacency(adjacency)))
+                if weights is not None:
+                    weights.append(graph.weight_from_adjacency(adjacency))
+            offsets.append(len(targets))
+            i += 1
+
+        return cls(
+            graph.label, tuple(v.value for v in vertexs), offsets, targets, weights
+        )
+
+    def size(self) -> int:
+        """
+        Devuelve el número de vértices del grafo.
+
+        Returns:
+            int: Número de vértices
+        """
+        return len(self.values)
+
+    def edges(self) -> int:
+        """
+        Devuelve el número de aristas del grafo.
+
+        Returns:
+            int: Número de aristas
+        """
+        return len(self.targets)
+
+    def neighbors(
+        self, vertex: int, direction: Graph.Direction = Graph.Direction.RIGHT
+    ) -> memoryview:
+        """
+        Devuelve los ids de los vecinos de un vértice sin copiar memoria.
+
+        Args:
+            vertex: Id del vértice
+            direction: Orden de las adyacencias (LEFT=invertido, RIGHT=natural)
+
+        Returns:
+            Vista de solo lectura sobre los destinos del vértice
+        """
+        row = self.targets[self.offsets[vertex] : self.offsets[vertex + 1]]
+        return row if direction == Graph.Direction.RIGHT else row[::-1]
+
+    def show_adjacencies(self) -> None:
+        """Muestra todas las adyacencias del grafo en formato legible."""
+        print(f"Adyacencias de {self.label}:")
+        for v in range(self.size()):
+            start, end = self.offsets[v], self.offsets[v + 1]
+            if self.weights is None:
+                adj_str = ", ".join(str(t) for t in self.targets[start:end])
+            else:
+                adj_str = ", ".join(
+                    f"({t}, {w})"
+                    for t, w in zip(self.targets[start:end], self.weights[start:end])
+                )
+            print(f"{v}: {self.values[v]} -> {{{adj_str}}}")
+        print()
+
+    def print_adjacency(
+        self, vertex: int, _: Optional[Any]
+    ) -> tuple[bool, Optional[Any]]:
+        """
+        Acción por defecto para imprimir vértices durante el recorrido.
+
+        Args:
+            vertex: Id del vértice actual
+            _: Argumento adicional no utilizado
+
+        Returns:
+            Tupla (False, None) para continuar el recorrido
+        """
+        print(f"  {vertex}: {self.values[vertex]}")
+        return (False, None)
+
+    def explore(
+        self,
+        start: int,
+        algorithm: Graph.Algorithm,
+        direction: Graph.Direction = Graph.Direction.RIGHT,
+        lvl_limit: Optional[int] = None,
+        action: Optional[
+            Callable[[int, Optional[Any]], tuple[bool, Optional[Any]]]
+        ] = None,
+        arg: Optional[Any] = None,
+    ) -> Optional[Any]:
+        """
+        Realiza un recorrido BFS o DFS ejecutando 'action' en cada vértice.
+
+        El estado de visitado vive en un bytearray propio del recorrido y el nivel
+        de cada vértice se calcula al descubrirlo, por lo que no hace falta
+        ejecutar set_lvls antes de limitar el nivel. Con límite, si DFS encuentra
+        un camino más corto a un vértice ya expandido lo vuelve a expandir (sin
+        repetir 'action') para no perder vértices dentro del límite.
+
+        Args:
+            start: Id del vértice donde inicia el recorrido
+            algorithm: Estrategia de recorrido (BFS o DFS)
+            direction: Orden de procesamiento de adyacencias (LEFT=invertido, RIGHT=natural)
+            lvl_limit: Nivel máximo a recorrer, el vértice inicial es el nivel 1
+            action: Función (id_vértice, arg) -> (detener_recorrido, valor_retorno)
+            arg: Argumento opcional que se pasa a la función 'action'
+
+        Returns:
+            Valor retornado por 'action' si detiene el recorrido, None en otro caso
+        """
+        if action is None:
+            action = self.print_adjacency
+
+        limitTitle = f"con límite {lvl_limit}" if lvl_limit is not None else ""
+        print(f"Recorrido {algorithm.name} por {direction.name} {limitTitle}")
+
+        offsets, targets = self.offsets, self.targets
+        reverse = direction == Graph.Direction.LEFT
+        visited = bytearray(self.size())
+        lvls = array("i", [0]) * self.size() if lvl_limit is not None else None
+        # Nivel con el que se expandió cada vértice (0 = sin expandir)
+        expanded_lvls = array("i", [0]) * self.size() if lvls is not None else None
+
+        vertex_to_check: deque[int] = deque([start])
+        get = (
+            vertex_to_check.pop
+            if algorithm == Graph.Algorithm.DFS
+            else vertex_to_check.popleft
+        )
+        add = vertex_to_check.append
+        visited[start] = 1
+        if lvls is not None:
+            lvls[start] = 1
+
+        while vertex_to_check:
+            curr_v = get()
+
+            if lvls is not None:
+                assert lvl_limit is not None and expanded_lvls is not None
+                lvl = lvls[curr_v]
+                previous = expanded_lvls[curr_v]
+                if previous and previous <= lvl:
+                    continue
+                expanded_lvls[curr_v] = lvl
+                if not previous:
+                    end_explore, value_return = action(curr_v, arg)
+                    if end_explore:
+                        print()
+                        return value_return
+
+                next_lvl = lvl + 1
+                if next_lvl > lvl_limit:
+                    continue
+                row = targets[offsets[curr_v] : offsets[curr_v + 1]]
+                for neighbor in row[::-1] if reverse else row:
+                    if not lvls[neighbor] or next_lvl < lvls[neighbor]:
+                        lvls[neighbor] = next_lvl
+                        add(neighbor)
+                continue
+
+            end_explore, value_return = action(curr_v, arg)
+            if end_explore:
+                print()
+                return value_return
+
+            row = targets[offsets[curr_v] : offsets[curr_v + 1]]
+            for neighbor in row[::-1] if reverse else row:
+                if not visited[neighbor]:
+                    visited[neighbor] = 1
+                    add(neighbor)
+
+        print()
+        return None
+
+    def seek(
+        self,
+        start: int,
+        seek: int,
+        algorithm: Graph.Algorithm = Graph.Algorithm.BFS,
+        direction: Graph.Direction = Graph.Direction.RIGHT,
+        lvl_limit: Optional[int] = None,
+    ) -> Optional[int]:
+        """
+        Busca un vértice en el grafo mediante recorrido.
+
+        Args:
+            start: Id del vértice inicial de búsqueda
+            seek: Id del vértice objetivo
+            algorithm: Algoritmo de búsqueda a utilizar
+            direction: Orden de procesamiento de adyacencias (LEFT=invertido, RIGHT=natural)
+            lvl_limit: Nivel máximo a recorrer
+
+        Returns:
+            Número de vértices visitados hasta encontrarlo, None si no existe
+        """
+
+        def action(v: int, arg: list[int]) -> tuple[bool, Any]:
+            arg[0] += 1
+            return (v == seek, arg[0])
+
+        print(f"Buscando {seek}: {self.values[seek]}")
+        return self.explore(
+            start=start,
+            algorithm=algorithm,
+            direction=direction,
+            lvl_limit=lvl_limit,
+            action=action,
+            arg=[0],
+        )
+
+    def set_lvls(
+        self, root: int, direction: Graph.Direction = Graph.Direction.RIGHT
+    ) -> array:
+        """
+        Calcula el nivel de cada vértice con un recorrido en anchura.
+
+        Como el grafo es inmutable, los niveles se devuelven en un arreglo en vez
+        de guardarse en los vértices.
+
+        Args:
+            root: Id del vértice que se considera nivel 1
+            direction: Orden de procesamiento de adyacencias
+
+        Returns:
+            Arreglo con el nivel de cada vértice, 0 si no es alcanzable desde root
+        """
+        print("Calculando niveles...")
+        offsets, targets = self.offsets, self.targets
+        reverse = direction == Graph.Direction.LEFT
+        lvls = array("i", [0]) * self.size()
+        lvls[root] = 1
+        vertex_to_check: deque[int] = deque([root])
+
+        while vertex_to_check:
+            curr_v = vertex_to_check.popleft()
+            next_lvl = lvls[curr_v] + 1
+            row = targets[offsets[curr_v] : offsets[curr_v + 1]]
+            for neighbor in row[::-1] if reverse else row:
+                if not lvls[neighbor]:
+                    lvls[neighbor] = next_lvl
+                    vertex_to_check.append(neighbor)
+
+        return lvls
+
+    def hill_climbing(
+        self,
+        start: int,
+        seek: int,
+        action: Callable[[int, int, Any], tuple[bool, Optional[Any]]],
+        heuristic: Callable[[int, int, int, Any], float],
+        objective: Graph.Objective = Graph.Objective.MINIMIZE,
+        arg: Optional[Any] = None,
+    ):
+        """
+        Recorrido Hill Climbing sobre ids de vértices.
+
+        Sigue la misma estrategia que Graph.hill_climbing, pero evalúa la
+        heurística una sola vez por vecino en cada paso.
+
+        Args:
+            start: Id del vértice inicial
+            seek: Id del vértice objetivo
+            action: Función (id_actual, id_objetivo, arg) -> (detener, valor_retorno)
+            heuristic: Función (id_vecino, id_actual, id_objetivo, arg) -> valor
+            objective: Minimizar o maximizar la heurística
+            arg: Argumento opcional para 'action' y 'heuristic'
+
+        Returns:
+            Valor retornado por 'action' al detenerse, None si no hay más vecinos
+        """
+        print("Recorrido Hill Climbing")
+        offsets, targets = self.offsets, self.targets
+        pick = min if objective == Graph.Objective.MINIMIZE else max
+        curr_v = start
+
+        while True:
+            end_explore, return_value = action(curr_v, seek, arg)
+            if end_explore:
+                return return_value
+
+            row = targets[offsets[curr_v] : offsets[curr_v + 1]]
+            if len(row) == 0:
+                return None
+
+            scores = [heuristic(v, curr_v, seek, arg) for v in row]
+            choosen_heuristic = pick(scores)
+            min_solutions = [v for v, h in zip(row, scores) if h == choosen_heuristic]
+            curr_v = min_solutions[randint(0, len(min_solutions) - 1)]
+
+    def a_star(
+        self,
+        start: int,
+        seek: int,
+        heuristic: Callable[[int, int, int, Any], float],
+        action: Optional[Callable[[int, int, Any], tuple[bool, Optional[Any]]]] = None,
+        arg: Optional[Any] = None,
+    ) -> Optional[tuple[list[int], float]]:
+        """
+        Búsqueda A* con montículo binario y conjunto cerrado.
+
+        El costo g se acumula con los pesos de las aristas (1.0 por arista si el
+        grafo no es ponderado) y las entradas obsoletas del montículo se descartan
+        al extraerlas (borrado perezoso).
+
+        Args:
+            start: Id del vértice inicial
+            seek: Id del vértice objetivo
+            heuristic: Función (id_vecino, id_actual, id_objetivo, arg) -> costo estimado
+            action: Función opcional (id_actual, id_objetivo, arg) -> (detener, _) que
+                se ejecuta al expandir cada vértice; si detiene, ese vértice se toma
+                como objetivo
+            arg: Argumento opcional para 'action' y 'heuristic'
+
+        Returns:
+            Tupla (camino de ids desde start, costo total), None si no hay camino
+        """
+        print("Recorrido A*")
+        offsets, targets, weights = self.offsets, self.targets, self.weights
+        n = self.size()
+        g_cost = array("d", [float("inf")]) * n
+        parents = array("i", [-1]) * n
+        closed = bytearray(n)
+
+        g_cost[start] = 0.0
+        agenda: list[tuple[float, float, int]] = [
+            (heuristic(start, start, seek, arg), 0.0, start)
+        ]
+
+        while agenda:
+            _, g, curr_v = heappop(agenda)
+            if closed[curr_v]:
+                continue
+            closed[curr_v] = 1
+
+            if action is not None:
+                end_explore, _ = action(curr_v, seek, arg)
+            else:
+                end_explore = curr_v == seek
+
+            if end_explore:
+                path = [curr_v]
+                while parents[path[-1]] != -1:
+                    path.append(parents[path[-1]])
+                path.reverse()
+                return (path, g)
+
+            for i in range(offsets[curr_v], offsets[curr_v + 1]):
+                neighbor = targets[i]
+                if closed[neighbor]:
+                    continue
+                new_g = g + (weights[i] if weights is not None else 1.0)
+                if new_g < g_cost[neighbor]:
+                    g_cost[neighbor] = new_g
+                    parents[neighbor] = curr_v
+                    f = new_g + heuristic(neighbor, curr_v, seek, arg)
+                    heappush(agenda, (f, new_g, neighbor))
+
+        return None
+
+    def dijkstra(self, start: int, seek: Optional[int] = None) -> tuple[array, array]:
+        """
+        Caminos mínimos de Dijkstra desde 'start' con montículo binario.
+
+        Con 'seek' la búsqueda termina en cuanto ese vértice sale del montículo;
+        las distancias de los vértices no extraídos son entonces solo cotas
+        superiores. Sin pesos cada arista cuesta 1.0.
+
+        Args:
+            start: Id del vértice origen
+            seek: Id opcional del vértice objetivo para terminar antes
+
+        Returns:
+            Tupla (distancias, predecesores): array('d') con la distancia de cada
+            vértice (inf si no se alcanzó) y array('i') con el id anterior en su
+            camino mínimo (-1 para el origen y los no alcanzados). El camino se
+            obtiene con graph.path_from_predecessors
+        """
+        print("Recorrido Dijkstra")
+        offsets, targets, weights = self.offsets, self.targets, self.weights
+        n = self.size()
+        dist = array("d", [float("inf")]) * n
+        preds = array("i", [-1]) * n
+        target = -1 if seek is None else seek
+        push, pop = heappush, heappop
+
+        dist[start] = 0.0
+        agenda: list[tuple[float, int]] = [(0.0, start)]
+        while agenda:
+            d, curr = pop(agenda)
+            # Entrada obsoleta: el vértice ya se extrajo con menor distancia
+            if d > dist[curr]:
+                continue
+            if curr == target:
+                break
+
+            begin, end = offsets[curr], offsets[curr + 1]
+            row_weights = (
+                weights[begin:end] if weights is not None else [1.0] * (end - begin)
+            )
+            for neighbor, weight in zip(targets[begin:end], row_weights):
+                new_d = d + weight
+                if new_d < dist[neighbor]:
+                    dist[neighbor] = new_d
+                    preds[neighbor] = curr
+                    push(agenda, (new_d, neighbor))
+
+        return (dist, preds)
@@ -1,9 +1,12 @@
 from abc import ABC, abstractmethod
+from array import array
+from collections import OrderedDict
 from enum import Enum, auto
+from heapq import heappop, heappush
 from random import randint
-from typing import Any, Callable, Generic, Optional, TypeVar
+from typing import Any, Callable, Generic, Iterable, Iterator, Optional, TypeVar
 
-from containers import Container, Queue, Stack
+from containers import ArrayQueue, ArrayStack, Container, Queue, Stack
 from nodes import NonWeightedVertex, Vertex, WeightedVertex
 
 T = TypeVar("T")
@@ -42,6 +45,12 @@ class Graph(Generic[T, Adjacency], ABC):
         MINIMIZE = auto()
         MAXIMIZE = auto()
 
+    class Storage(Enum):
+        """Enumera las implementaciones de contenedor para los recorridos"""
+
+        LINKED = auto()  # Queue/Stack con nodos doblemente enlazados
+        ARRAY = auto()  # ArrayQueue (buffer circular) / ArrayStack (arreglo)
+
     def __init__(
         self, label: str, vertexs: Optional[list[Vertex[T, Adjacency]]] = None
     ) -> None:
@@ -58,6 +67,7 @@ class Graph(Generic[T, Adjacency], ABC):
             raise ValueError("All elements in 'vertexs' must be instances of Vertex.")
 
         self.vertexs: list[Vertex[T, Adjacency]] = vertexs if vertexs else []
+        self._reverse_index: Optional[dict[int, list[Vertex[T, Adjacency]]]] = None
 
     @abstractmethod
     def vertex_from_adjacency(self, adjacency: Adjacency) -> Vertex[T, Adjacency]:
@@ -72,6 +82,78 @@ class Graph(Generic[T, Adjacency], ABC):
         """
         pass
 
+    def adjacencies_of(self, vertex: Vertex[T, Adjacency]) -> list[Adjacency]:
+        """
+        Obtiene las adyacencias de un vértice.
+
+        Los recorridos piden las adyacencias a través de este método para que
+        un grafo pueda generarlas bajo demanda en lugar de tenerlas guardadas.
+
+        Args:
+            vertex: Vértice del que se quieren las adyacencias
+
+        Returns:
+            Lista de adyacencias del vértice
+        """
+        return vertex.adjacencies
+
+    def predecessors_of(
+        self, vertex: Vertex[T, Adjacency]
+    ) -> list[Vertex[T, Adjacency]]:
+        """
+        Obtiene los vértices que tienen una arista hacia 'vertex'.
+
+        La primera llamada construye un índice inverso recorriendo todos los
+        vértices alcanzables desde self.vertexs; si después se modifican las
+        adyacencias hay que llamar a reset_reverse_index.
+
+        Args:
+            vertex: Vértice del que se quieren los predecesores
+
+        Returns:
+            Lista de vértices predecesores
+        """
+        if self._reverse_index is None:
+            self._reverse_index = self.reverse_index()
+        return self._reverse_index.get(id(vertex), [])
+
+    def reverse_index(self) -> dict[int, list[Vertex[T, Adjacency]]]:
+        """
+        Construye la adyacencia inversa de todos los vértices alcanzables desde
+        self.vertexs.
+
+        Returns:
+            Diccionario id(vértice) -> vértices con una arista hacia él
+        """
+        reverse: dict[int, list[Vertex[T, Adjacency]]] = {}
+        pending = list(self.vertexs)
+        seen = {id(v) for v in pending}
+        while pending:
+            vertex = pending.pop()
+            for adjacency in self.adjacencies_of(vertex):
+                neighbor = self.vertex_from_adjacency(adjacency)
+                reverse.setdefault(id(neighbor), []).append(vertex)
+                if id(neighbor) not in seen:
+                    seen.add(id(neighbor))
+                    pending.append(neighbor)
+        return reverse
+
+    def reset_reverse_index(self) -> None:
+        """Descarta el índice inverso para que se reconstruya en la siguiente consulta."""
+        self._reverse_index = None
+
+    def weight_from_adjacency(self, adjacency: Adjacency) -> float:
+        """
+        Obtiene el peso (costo) asociado a una adyacencia.
+
+        Args:
+            adjacency: Relación de adyacencia a consultar
+
+        Returns:
+            Peso de la arista, 1.0 para grafos no ponderados
+        """
+        return 1.0
+
     def adj_str(self, adjacency: Adjacency) -> str:
         """
         Formatea una adyacencia para representación como cadena.
@@ -93,7 +175,12 @@ class Graph(Generic[T, Adjacency], ABC):
         print()
 
     def reset_visited(self) -> None:
-        """Reinicia el estado de visitado de todos los vértices."""
+        """
+        Reinicia el atributo visited de todos los vértices.
+
+        Los recorridos ya no usan Vertex.visited (llevan su propio conjunto de
+        visitados), este método se conserva para código que marque vértices a mano.
+        """
         for vertex in self.vertexs:
             vertex.visited = False
 
@@ -146,6 +233,7 @@ class Graph(Generic[T, Adjacency], ABC):
         lvl_limit: Optional[int] = None,
         set_lvls: bool = False,
         iterative: bool = False,
+        storage: Storage = Storage.LINKED,
         action: Optional[
             Callable[[Vertex[T, Adjacency], Optional[Any]], tuple[bool, Optional[Any]]]
         ] = None,
@@ -158,12 +246,12 @@ class Graph(Generic[T, Adjacency], ABC):
             start: Vértice raíz donde inicia el recorrido
             algorithm: Estrategia de recorrido (Algoritmo.BFS o Algoritmo.DFS)
             direction: Orden de procesamiento de adyacencias (LEFT=invertido, RIGHT=natural)
-            lvl_limit: Limitar la busqueda a un nivel específico, para esto los vértices deben
-                tener el nivel puesto de forma correcta, si no se estableció ningún nivel la función
-                soltará una excepción durante el recorrido o si se establecen niveles mal puede ocurrir
-                un comportamiento inesperado
+            lvl_limit: Limitar la busqueda a un nivel específico (el vértice inicial es el
+                nivel 1). La profundidad se calcula durante el recorrido, no hace falta set_lvls
             set_lvls: Ejecutar la función self.set_lvls(start) antes de empezar la exploración
-            iterative: Recorrer un arbol de forma iterativa (potencial error de ciclado en grafos)
+            iterative: Recorrer un arbol de forma iterativa (potencial error de ciclado en grafos),
+                para grafos con ciclos usar iterative_deepening
+            storage: Implementación del contenedor de vértices por visitar (LINKED o ARRAY)
             action: Función callback con firma:
                    (vértice_actual, arg) -> (detener_recorrido: bool, valor_retorno: Any)
                    - Si detener_recorrido = True, se aborta el recorrido y retorna valor_retorno
@@ -175,15 +263,7 @@ class Graph(Generic[T, Adjacency], ABC):
             - None si completa todo el recorrido sin interrupciones
         """
         if set_lvls:
-            self.set_lvls(start)
-
-        loop = 1
-        vertex_visited = 0
-        vertex_before_loop = 0
-
-        vertex_to_check: Container[Vertex[T, Adjacency]] = (
-            Stack() if algorithm == self.Algorithm.DFS else Queue()
-        )
+            self.set_lvls(start, storage=storage)
 
         if action is None:
             action = self.print_adjacency
@@ -192,10 +272,28 @@ class Graph(Generic[T, Adjacency], ABC):
         limitTitle = f"con límite {lvl_limit}" if lvl_limit is not None else ""
         print(f"Recorrido {algorithm.name} por {direction.name} {limitTitle}")
 
+        if not iterative:
+            for curr_v in self.iter_explore(
+                start, algorithm, direction, lvl_limit=lvl_limit, storage=storage
+            ):
+                end_explore, value_return = action(curr_v, arg)
+
+                if end_explore:
+                    print()
+                    return value_return
+
+            print()
+            return None
+
+        loop = 1
+        vertex_visited = 0
+        vertex_before_loop = 0
+
+        vertex_to_check = self.new_container(algorithm, storage)
+        depths: dict[int, int] = {id(start): 1}
+
         vertex_to_check.add(start)
         vertex_before_loop += 1
-        if not iterative:
-            start.visited = True
 
         while not vertex_to_check.is_empty():
             curr_v = vertex_to_check.get()
@@ -207,46 +305,153 @@ class Graph(Generic[T, Adjacency], ABC):
 
             if end_explore:
                 print()
-                self.reset_visited()
                 return value_return
 
             vertex_visited += 1
 
-            if iterative and vertex_visited == vertex_before_loop:
+            if vertex_visited == vertex_before_loop:
                 loop += 1
-                vertex_to_check = (
-                    Stack() if algorithm == self.Algorithm.DFS else Queue()
-                )
+                vertex_to_check = self.new_container(algorithm, storage)
                 vertex_to_check.add(start)
                 vertex_before_loop += 1
                 vertex_visited = 0
                 print(f"\nIteración {loop}")
                 continue
 
+            next_depth = depths[id(curr_v)] + 1
+            if lvl_limit is not None and next_depth > lvl_limit:
+                continue
+
             adjacencies = (
-                curr_v.adjacencies
+                self.adjacencies_of(curr_v)
                 if direction == self.Direction.RIGHT
-                else list(reversed(curr_v.adjacencies))
+                else list(reversed(self.adjacencies_of(curr_v)))
             )
 
+            neighbors: list[Vertex[T, Adjacency]] = []
             for adjacency in adjacencies:
                 neighbor = self.vertex_from_adjacency(adjacency)
+                depths[id(neighbor)] = next_depth
+                neighbors.append(neighbor)
 
-                if lvl_limit is not None:
-                    assert neighbor.lvl
-                    should_add = not neighbor.visited and neighbor.lvl <= lvl_limit
+            vertex_to_check.extend(neighbors)
+
+        print()
+        return None
 
+    def iter_explore(
+        self,
+        start: Vertex[T, Adjacency],
+        algorithm: Algorithm,
+        direction: Direction = Direction.RIGHT,
+        lvl_limit: Optional[int] = None,
+        storage: Storage = Storage.LINKED,
+        details: bool = False,
+    ) -> Iterator[Any]:
+        """
+        Recorrido BFS o DFS perezoso: genera los vértices en el orden de visita.
+
+        Solo avanza cuando se pide el siguiente vértice, así que se puede
+        combinar con itertools (islice, takewhile, ...) o abandonar el recorrido
+        sin costo adicional. No imprime nada.
+
+        Args:
+            start: Vértice raíz donde inicia el recorrido
+            algorithm: Estrategia de recorrido (BFS o DFS)
+            direction: Orden de procesamiento de adyacencias (LEFT=invertido, RIGHT=natural)
+            lvl_limit: Nivel máximo a recorrer (el vértice inicial es el nivel 1).
+                Cada vértice guarda la menor profundidad con la que se descubrió y
+                no se generan los vecinos de los que ya están en el límite. En DFS,
+                si aparece un camino más corto a un vértice ya visitado, se vuelve
+                a expandir (sin generarlo otra vez) para no perder vértices dentro
+                del límite
+            storage: Implementación del contenedor de vértices por visitar (LINKED o ARRAY)
+            details: Si es True genera tuplas (vértice, profundidad, padre) en lugar
+                de solo el vértice; el padre del inicio es None
+
+        Returns:
+            Iterador de vértices o de tuplas (vértice, profundidad, padre)
+        """
+        vertex_to_check = self.new_container(algorithm, storage)
+        vertex_to_check.add(start)
+
+        # Estado de visitado propio del recorrido: cuesta O(visitados) y permite
+        # ejecutar varios recorridos sobre el mismo grafo desde distintos hilos
+        visited: set[int] = {id(start)}
+        depths: dict[int, int] = {id(start): 1}
+        parents: dict[int, Optional[Vertex[T, Adjacency]]] = {id(start): None}
+        expanded_at: dict[int, int] = {}
+        track = details or lvl_limit is not None
+
+        while not vertex_to_check.is_empty():
+            curr_v = vertex_to_check.get()
+
+            if curr_v is None:
+                raise RuntimeError("Vertice actual es None")
+
+            first_visit = True
+            if lvl_limit is not None:
+                depth = depths[id(curr_v)]
+                previous = expanded_at.get(id(curr_v))
+                if previous is not None and previous <= depth:
+                    continue
+                first_visit = previous is None
+                expanded_at[id(curr_v)] = depth
+
+            if first_visit:
+                if details:
+                    yield (curr_v, depths[id(curr_v)], parents[id(curr_v)])
                 else:
-                    should_add = not neighbor.visited
+                    yield curr_v
 
-                if should_add:
-                    vertex_to_check.add(neighbor)
-                    if not iterative:
-                        neighbor.visited = True
+            if track:
+                next_depth = depths[id(curr_v)] + 1
+                if lvl_limit is not None and next_depth > lvl_limit:
+                    # Los vecinos quedarían fuera del límite: ni se generan
+                    continue
 
-        print()
-        self.reset_visited()
-        return None
+            adjacencies = (
+                self.adjacencies_of(curr_v)
+                if direction == self.Direction.RIGHT
+                else list(reversed(self.adjacencies_of(curr_v)))
+            )
+
+            # Se agregan todos los vecinos nuevos al contenedor en una sola llamada
+            neighbors: list[Vertex[T, Adjacency]] = []
+            for adjacency in adjacencies:
+                neighbor = self.vertex_from_adjacency(adjacency)
+
+                if lvl_limit is not None:
+                    if next_depth >= depths.get(id(neighbor), lvl_limit + 1):
+                        continue
+                elif id(neighbor) in visited:
+                    continue
+                else:
+                    visited.add(id(neighbor))
+
+                if track:
+                    depths[id(neighbor)] = next_depth
+                    parents[id(neighbor)] = curr_v
+                neighbors.append(neighbor)
+
+            vertex_to_check.extend(neighbors)
+
+    def new_container(
+        self, algorithm: Algorithm, storage: Storage = Storage.LINKED
+    ) -> Container[Vertex[T, Adjacency]]:
+        """
+        Crea el contenedor de vértices por visitar para un recorrido.
+
+        Args:
+            algorithm: BFS usa una cola, DFS una pila
+            storage: LINKED usa nodos enlazados, ARRAY usa arreglos
+
+        Returns:
+            Contenedor vacío
+        """
+        if storage == self.Storage.ARRAY:
+            return ArrayStack() if algorithm == self.Algorithm.DFS else ArrayQueue()
+        return Stack() if algorithm == self.Algorithm.DFS else Queue()
 
     def seek(
         self,
@@ -257,6 +462,7 @@ class Graph(Generic[T, Adjacency], ABC):
         lvl_limit: Optional[int] = None,
         set_lvls: bool = False,
         iterative: bool = False,
+        storage: Storage = Storage.LINKED,
         eval_eq: Callable[
             [Vertex[T, Adjacency], Vertex[T, Adjacency]], bool
         ] = lambda v1, v2: v1
@@ -271,11 +477,10 @@ class Graph(Generic[T, Adjacency], ABC):
             algorithm: Algoritmo de búsqueda a utilizar
             direction: Dirección de procesamiento de adyacencias
             direction: Orden de procesamiento de adyacencias (LEFT=invertido, RIGHT=natural)
-            lvl_limit: Limitar la busqueda a un nivel específico, para esto los vértices deben
-                tener el nivel puesto de forma correcta, si no se estableció ningún nivel la función
-                soltará una excepción durante el recorrido o si se establecen niveles mal puede ocurrir
-                un comportamiento inesperado
+            lvl_limit: Limitar la busqueda a un nivel específico (el vértice inicial es el
+                nivel 1). La profundidad se calcula durante el recorrido, no hace falta set_lvls
             set_lvls: Ejecutar la función self.set_lvls(start) antes de empezar la exploración
+            storage: Implementación del contenedor de vértices por visitar (LINKED o ARRAY)
 
         Returns:
             None cuando encuentra el vértice o si no existe
@@ -298,39 +503,135 @@ class Graph(Generic[T, Adjacency], ABC):
             lvl_limit=lvl_limit,
             set_lvls=set_lvls,
             iterative=iterative,
+            storage=storage,
         )
 
+    def bidirectional_seek(
+        self,
+        start: Vertex[T, Adjacency],
+        seek: Vertex[T, Adjacency],
+        directed: bool = True,
+    ) -> Optional[list[Vertex[T, Adjacency]]]:
+        """
+        Búsqueda BFS bidireccional: expande a la vez desde 'start' (por las
+        adyacencias) y desde 'seek' (por los predecesores) hasta que las dos
+        fronteras se encuentran.
+
+        En cada paso se expande un nivel completo de la frontera más pequeña,
+        lo que reduce los vértices expandidos de O(b^d) a O(b^(d/2)). Entre los
+        encuentros de un mismo nivel se conserva el de menor longitud total, así
+        el camino tiene el mínimo número de aristas.
+
+        Args:
+            start: Vértice inicial
+            seek: Vértice objetivo
+            directed: Si es False las aristas se consideran simétricas y la
+                búsqueda hacia atrás usa las adyacencias en lugar de
+                predecessors_of (no hace falta construir el índice inverso)
+
+        Returns:
+            Camino desde start hasta seek, o None si no existe
+        """
+        print(f"Búsqueda bidireccional de {start} a {seek}")
+        if start is seek:
+            return [start]
+
+        def forward(v: Vertex[T, Adjacency]) -> list[Vertex[T, Adjacency]]:
+            return [self.vertex_from_adjacency(a) for a in self.adjacencies_of(v)]
+
+        backward = forward if not directed else self.predecessors_of
+
+        # Por lado: id -> (vértice, profundidad, padre hacia su origen)
+        sides: list[
+            dict[
+                int,
+                tuple[Vertex[T, Adjacency], int, Optional[Vertex[T, Adjacency]]],
+            ]
+        ] = [{id(start): (start, 0, None)}, {id(seek): (seek, 0, None)}]
+        frontiers = [[start], [seek]]
+        expand = [forward, backward]
+        expanded = 0
+
+        while frontiers[0] and frontiers[1]:
+            side = 0 if len(frontiers[0]) <= len(frontiers[1]) else 1
+            seen, other = sides[side], sides[1 - side]
+            best: Optional[tuple[int, Vertex[T, Adjacency], Vertex[T, Adjacency]]] = (
+                None
+            )
+            next_frontier: list[Vertex[T, Adjacency]] = []
+
+            for curr_v in frontiers[side]:
+                expanded += 1
+                depth = seen[id(curr_v)][1]
+                for neighbor in expand[side](curr_v):
+                    if id(neighbor) in other:
+                        length = depth + 1 + other[id(neighbor)][1]
+                        if best is None or length < best[0]:
+                            best = (length, curr_v, neighbor)
+                    if id(neighbor) not in seen:
+                        seen[id(neighbor)] = (neighbor, depth + 1, curr_v)
+                        next_frontier.append(neighbor)
+
+            if best is not None:
+                print(f"Vértices expandidos: {expanded}\n")
+                _, near, meeting = best
+                # near está del lado 'side' y meeting es su vecino ya visto
+                # por el otro lado
+                half: list[Vertex[T, Adjacency]] = []
+                walk: Optional[Vertex[T, Adjacency]] = near
+                while walk is not None:
+                    half.append(walk)
+                    walk = seen[id(walk)][2]
+                other_half: list[Vertex[T, Adjacency]] = []
+                walk = meeting
+                while walk is not None:
+                    other_half.append(walk)
+                    walk = other[id(walk)][2]
+
+                half.reverse()
+                path = half + other_half
+                return path if side == 0 else path[::-1]
+
+            frontiers[side] = next_frontier
+
+        print(f"Vértices expandidos: {expanded}\n")
+        return None
+
     def set_lvls(
-        self, root: Vertex[T, Adjacency], direction: Direction = Direction.RIGHT
+        self,
+        root: Vertex[T, Adjacency],
+        direction: Direction = Direction.RIGHT,
+        storage: Storage = Storage.LINKED,
     ):
-        vertex_to_check = Queue[Vertex[T, Adjacency]]()
+        vertex_to_check = self.new_container(self.Algorithm.BFS, storage)
         print("Calculando niveles...")
-        root.visited = True
+        visited: set[int] = {id(root)}
         root.lvl = 1
-        vertex_to_check.enqueue(root)
+        vertex_to_check.add(root)
 
         while not vertex_to_check.is_empty():
-            curr_v = vertex_to_check.get()
-            assert curr_v is not None
-            assert curr_v.lvl is not None
+            # Se procesa un nivel completo por iteración
+            for curr_v in vertex_to_check.drain():
+                assert curr_v.lvl is not None
 
-            print(f"  {curr_v}")
+                print(f"  {curr_v}")
 
-            adjacencies = (
-                curr_v.adjacencies
-                if direction == self.Direction.RIGHT
-                else list(reversed(curr_v.adjacencies))
-            )
+                adjacencies = (
+                    self.adjacencies_of(curr_v)
+                    if direction == self.Direction.RIGHT
+                    else list(reversed(self.adjacencies_of(curr_v)))
+                )
 
-            for adj in adjacencies:
-                vertex = self.vertex_from_adjacency(adj)
-                if not vertex.visited:
-                    vertex.visited = True
-                    vertex.lvl = curr_v.lvl + 1
-                    vertex_to_check.add(vertex)
+                next_lvl: list[Vertex[T, Adjacency]] = []
+                for adj in adjacencies:
+                    vertex = self.vertex_from_adjacency(adj)
+                    if id(vertex) not in visited:
+                        visited.add(id(vertex))
+                        vertex.lvl = curr_v.lvl + 1
+                        next_lvl.append(vertex)
+                vertex_to_check.extend(next_lvl)
 
         print()
-        self.reset_visited()
 
     def hill_climbing(
         self,
@@ -355,9 +656,33 @@ class Graph(Generic[T, Adjacency], ABC):
         ],
         objective: Objective = Objective.MINIMIZE,
         arg: Optional[Any] = None,
+        cache: Optional["HeuristicCache[T, Adjacency]"] = None,
     ):
+        """
+        Recorrido Hill Climbing: avanza siempre al vecino con mejor heurística.
+
+        La heurística se evalúa a través de un HeuristicCache, de modo que cada
+        par (vértice, objetivo) se calcula como máximo una vez por búsqueda. La
+        heurística cacheada no debe depender de curr_v.
+
+        Args:
+            start: Vértice inicial
+            seek: Vértice objetivo
+            action: Función (actual, objetivo, arg) -> (detener, valor_retorno)
+            heuristic: Función (vecino, actual, objetivo, arg) -> valor
+            objective: Minimizar o maximizar la heurística
+            arg: Argumento opcional para 'action' y 'heuristic'
+            cache: Caché a utilizar; si es None se crea uno nuevo para esta
+                búsqueda. Pasar uno propio permite consultar sus estadísticas
+                (hits, misses, hit_rate) al terminar
+
+        Returns:
+            Valor retornado por 'action' al detenerse, None si no hay más vecinos
+        """
         print("Recorrido Hill Climbing")
-        reverse = False if objective == self.Objective.MINIMIZE else True
+        if cache is None:
+            cache = HeuristicCache(heuristic)
+        pick = min if objective == self.Objective.MINIMIZE else max
         agenda: list[Vertex[T, Adjacency]] = []
         agenda.append(start)
         while not len(agenda) == 0:
@@ -369,24 +694,20 @@ class Graph(Generic[T, Adjacency], ABC):
             if end_explore:
                 return returnValue
 
-            for adjacency in curr_v.adjacencies:
+            for adjacency in self.adjacencies_of(curr_v):
                 vertex = self.vertex_from_adjacency(adjacency)
                 agenda.append(vertex)
 
             if len(agenda) != 0:
-                # Ordenar la agenda usando la heurística
-                agenda.sort(
-                    key=lambda v: heuristic(v, curr_v, seek, arg), reverse=reverse
-                )
+                # Evaluar la heurística una sola vez por vértice de la agenda
+                scores = [cache(v, curr_v, seek, arg) for v in agenda]
 
-                # Obtener el valor mínimo de la heurística
-                choosen_heuristic = heuristic(agenda[0], curr_v, seek, arg)
+                # Obtener el mejor valor de la heurística
+                choosen_heuristic = pick(scores)
 
-                # Filtrar las soluciones con la heurística mínima
+                # Filtrar las soluciones con la mejor heurística
                 min_solutions = [
-                    v
-                    for v in agenda
-                    if heuristic(v, curr_v, seek, arg) == choosen_heuristic
+                    v for v, h in zip(agenda, scores) if h == choosen_heuristic
                 ]
 
                 # Elegir una solución
@@ -400,14 +721,6 @@ class Graph(Generic[T, Adjacency], ABC):
         self,
         start: Vertex[T, Adjacency],
         seek: Vertex[T, Adjacency],
-        action: Callable[
-            [
-                Vertex[T, Adjacency],  # curr_v
-                Vertex[T, Adjacency],  # seek
-                Any,  # arg
-            ],
-            tuple[bool, Optional[Any]],  # (end_explore, return)
-        ],
         heuristic: Callable[
             [
                 Vertex[T, Adjacency],  # adjacency
@@ -417,7 +730,170 @@ class Graph(Generic[T, Adjacency], ABC):
             ],
             float,
         ],
-        g: Callable[
+        action: Optional[
+            Callable[
+                [
+                    Vertex[T, Adjacency],  # curr_v
+                    Vertex[T, Adjacency],  # seek
+                    Any,  # arg
+                ],
+                tuple[bool, Optional[Any]],  # (end_explore, _)
+            ]
+        ] = None,
+        arg: Optional[Any] = None,
+    ) -> Optional[tuple[list[Vertex[T, Adjacency]], float]]:
+        """
+        Búsqueda A* con montículo binario, conjunto cerrado y reconstrucción del camino.
+
+        El costo g se acumula con self.weight_from_adjacency (pesos de las aristas
+        en WeightedGraph, 1.0 por arista en NonWeightedGraph). Las entradas
+        obsoletas del montículo se descartan al extraerlas (borrado perezoso), de
+        modo que la memoria crece con los vértices alcanzados y no con las
+        reordenaciones de la agenda.
+
+        Args:
+            start: Vértice inicial
+            seek: Vértice objetivo
+            heuristic: Función (vecino, actual, objetivo, arg) -> costo estimado
+                hasta el objetivo, debe ser admisible para obtener el camino óptimo
+            action: Función opcional (actual, objetivo, arg) -> (detener, _) que se
+                ejecuta al expandir cada vértice; si detiene, ese vértice se toma
+                como objetivo. Por defecto se compara la identidad con 'seek'
+            arg: Argumento opcional para 'action' y 'heuristic'
+
+        Returns:
+            Tupla (camino desde start hasta el objetivo, costo total), o None si
+            no existe camino
+        """
+        print("Recorrido A*")
+        g_cost: dict[int, float] = {id(start): 0.0}
+        parents: dict[int, Vertex[T, Adjacency]] = {}
+        closed: set[int] = set()
+
+        # (f, g, desempate, vértice): el contador evita comparar vértices
+        counter = 0
+        agenda: list[tuple[float, float, int, Vertex[T, Adjacency]]] = [
+            (heuristic(start, start, seek, arg), 0.0, counter, start)
+        ]
+
+        while agenda:
+            _, g, _, curr_v = heappop(agenda)
+            if id(curr_v) in closed:
+                continue
+            closed.add(id(curr_v))
+
+            if action is not None:
+                end_explore, _ = action(curr_v, seek, arg)
+            else:
+                end_explore = curr_v is seek
+
+            if end_explore:
+                path = [curr_v]
+                while id(path[-1]) in parents:
+                    path.append(parents[id(path[-1])])
+                path.reverse()
+                return (path, g)
+
+            for adjacency in self.adjacencies_of(curr_v):
+                vertex = self.vertex_from_adjacency(adjacency)
+                if id(vertex) in closed:
+                    continue
+
+                new_g = g + self.weight_from_adjacency(adjacency)
+                if new_g < g_cost.get(id(vertex), float("inf")):
+                    g_cost[id(vertex)] = new_g
+                    parents[id(vertex)] = curr_v
+                    counter += 1
+                    f = new_g + heuristic(vertex, curr_v, seek, arg)
+                    heappush(agenda, (f, new_g, counter, vertex))
+
+        return None
+
+    def iterative_deepening(
+        self,
+        start: Vertex[T, Adjacency],
+        max_depth: Optional[int] = None,
+        direction: Direction = Direction.RIGHT,
+        action: Optional[
+            Callable[[Vertex[T, Adjacency], Optional[Any]], tuple[bool, Optional[Any]]]
+        ] = None,
+        arg: Optional[Any] = None,
+        expansions: Optional[list[int]] = None,
+    ) -> Optional[Any]:
+        """
+        Búsqueda en profundidad iterativa (IDDFS) sin niveles precalculados.
+
+        Cada iteración es un DFS con pila explícita de marcos (vértice,
+        profundidad, adyacencias pendientes) limitado a la profundidad de la
+        iteración, así que no hace falta set_lvls y la memoria es proporcional a
+        la profundidad. Los ciclos se detectan contra el camino actual, por lo
+        que funciona en grafos cíclicos.
+
+        'action' se ejecuta sobre los vértices que están exactamente a la
+        profundidad límite de la iteración, de modo que cada iteración solo
+        revisa la nueva capa y el primer vértice que detiene la búsqueda es uno
+        de profundidad mínima.
+
+        Args:
+            start: Vértice raíz
+            max_depth: Profundidad máxima, None para seguir mientras queden
+                vértices más profundos
+            direction: Orden de procesamiento de adyacencias (LEFT=invertido, RIGHT=natural)
+            action: Función (vértice, arg) -> (detener, valor_retorno)
+            arg: Argumento opcional para 'action'
+            expansions: Lista opcional donde se agrega el número de vértices
+                expandidos en cada iteración
+
+        Returns:
+            Valor retornado por 'action' al detenerse, None si no se detuvo
+        """
+        if action is None:
+            action = self.print_adjacency
+        assert action is not None
+
+        print(f"Recorrido IDDFS por {direction.name}")
+        limit = 0
+        while max_depth is None or limit <= max_depth:
+            print(f"Iteración {limit + 1} (profundidad {limit})")
+            result: list[Any] = []
+
+            def at_limit(vertex: Vertex[T, Adjacency], depth: float) -> bool:
+                if depth < limit:
+                    return False
+                end_explore, value = action(vertex, arg)
+                if end_explore:
+                    result.append(value)
+                return end_explore
+
+            # Cada arista cuenta 1 sin importar su peso: la profundidad es el
+            # número de aristas desde start
+            path, _, next_bound, expanded = self._bounded_dfs(
+                start,
+                limit,
+                lambda _adjacency: 1.0,
+                lambda _v, _curr_v: 0.0,
+                at_limit,
+                direction,
+            )
+            if expansions is not None:
+                expansions.append(expanded)
+
+            if path is not None:
+                print()
+                return result[0]
+            # Ningún vértice quedó fuera por el límite: ya se recorrió todo
+            if next_bound == float("inf"):
+                break
+            limit += 1
+
+        print()
+        return None
+
+    def ida_star(
+        self,
+        start: Vertex[T, Adjacency],
+        seek: Vertex[T, Adjacency],
+        heuristic: Callable[
             [
                 Vertex[T, Adjacency],  # adjacency
                 Vertex[T, Adjacency],  # curr_v
@@ -426,57 +902,298 @@ class Graph(Generic[T, Adjacency], ABC):
             ],
             float,
         ],
-        objective: Objective = Objective.MINIMIZE,
         arg: Optional[Any] = None,
-    ):
-        print("Recorrido A*")
-        reverse = False if objective == self.Objective.MINIMIZE else True
+        expansions: Optional[list[int]] = None,
+    ) -> Optional[tuple[list[Vertex[T, Adjacency]], float]]:
+        """
+        IDA*: profundización iterativa sobre f = g + h.
 
-        agenda: list[Vertex[T, Adjacency]] = []
+        Cada iteración es un DFS con pila explícita que poda los vértices cuyo f
+        supera la cota; la siguiente cota es el menor f podado. Usa memoria
+        proporcional a la longitud del camino en lugar de guardar la agenda
+        completa como a_star. Los costos se acumulan con self.weight_from_adjacency.
 
-        agenda.append(start)
+        Args:
+            start: Vértice inicial
+            seek: Vértice objetivo
+            heuristic: Función (vecino, actual, objetivo, arg) -> costo estimado
+                hasta el objetivo, la misma que acepta a_star; debe ser
+                admisible para obtener el camino óptimo
+            arg: Argumento opcional para 'heuristic'
+            expansions: Lista opcional donde se agrega el número de vértices
+                expandidos en cada iteración
 
-        def f(
-            adjacency: Vertex[T, Adjacency],  # adjacency
-            curr_v: Vertex[T, Adjacency],  # curr_v
-            seek: Vertex[T, Adjacency],  # seek
-            arg: Any,  # arg
-        ) -> float:
-            return g(adjacency, curr_v, seek, arg) + heuristic(
-                adjacency, curr_v, seek, arg
+        Returns:
+            Tupla (camino desde start hasta seek, costo total), o None si no
+            existe camino
+        """
+        print("Recorrido IDA*")
+        bound = heuristic(start, start, seek, arg)
+        iteration = 0
+        while bound != float("inf"):
+            iteration += 1
+            path, cost, bound, expanded = self._bounded_dfs(
+                start,
+                bound,
+                self.weight_from_adjacency,
+                lambda v, curr_v: heuristic(v, curr_v, seek, arg),
+                lambda v, _g: v is seek,
             )
+            print(f"Iteración {iteration}: {expanded} vértices expandidos")
+            if expansions is not None:
+                expansions.append(expanded)
+            if path is not None:
+                return (path, cost)
 
-        while len(agenda) != 0:
-            curr_v = agenda.pop()
+        return None
 
-            end_explore, return_value = action(curr_v, seek, arg)
+    def _bounded_dfs(
+        self,
+        start: Vertex[T, Adjacency],
+        bound: float,
+        step_cost: Callable[[Adjacency], float],
+        heuristic: Callable[[Vertex[T, Adjacency], Vertex[T, Adjacency]], float],
+        is_goal: Callable[[Vertex[T, Adjacency], float], bool],
+        direction: Direction = Direction.RIGHT,
+    ) -> tuple[Optional[list[Vertex[T, Adjacency]]], float, float, int]:
+        """
+        DFS acotado con pila explícita, base de iterative_deepening e ida_star.
 
-            if end_explore:
-                return return_value
+        g se acumula con step_cost(adyacencia) y un vértice se poda si
+        g + heuristic(vértice, actual) supera 'bound'; no se visitan vértices
+        que ya estén en el camino actual.
 
-            for adjacency in curr_v.adjacencies:
-                vertex = self.vertex_from_adjacency(adjacency)
-                agenda.append(vertex)
+        Returns:
+            Tupla (camino al objetivo o None, costo del camino, menor f podado
+            o inf si no se podó nada, vértices expandidos)
+        """
+        next_bound = float("inf")
+        expanded = 0
+
+        f = heuristic(start, start)
+        if f > bound:
+            return (None, 0.0, f, 0)
+        if is_goal(start, 0.0):
+            return ([start], 0.0, next_bound, 0)
+
+        # Marco: [vértice, g, adyacencias pendientes]
+        frames: list[tuple[Vertex[T, Adjacency], float, Any]] = []
+        on_path: set[int] = set()
+
+        def push(vertex: Vertex[T, Adjacency], g: float) -> None:
+            nonlocal expanded
+            expanded += 1
+            adjacencies = self.adjacencies_of(vertex)
+            if direction == self.Direction.LEFT:
+                adjacencies = list(reversed(adjacencies))
+            frames.append((vertex, g, iter(adjacencies)))
+            on_path.add(id(vertex))
+
+        push(start, 0.0)
+        while frames:
+            vertex, g, pending = frames[-1]
+            adjacency = next(pending, None)
+            if adjacency is None:
+                frames.pop()
+                on_path.discard(id(vertex))
+                continue
 
-            if len(agenda) != 0:
-                # Ordenar la agenda usando la heurística
-                agenda.sort(
-                    key=lambda v: f(v, curr_v, seek, arg),
-                    reverse=reverse,
+            neighbor = self.vertex_from_adjacency(adjacency)
+            if id(neighbor) in on_path:
+                continue
+
+            new_g = g + step_cost(adjacency)
+            f = new_g + heuristic(neighbor, vertex)
+            if f > bound:
+                next_bound = min(next_bound, f)
+                continue
+
+            if is_goal(neighbor, new_g):
+                return (
+                    [frame[0] for frame in frames] + [neighbor],
+                    new_g,
+                    next_bound,
+                    expanded,
                 )
+            push(neighbor, new_g)
 
-                # Obtener el valor mínimo de la heurística
-                choosen_heuristic = f(agenda[0], curr_v, seek, arg)
+        return (None, 0.0, next_bound, expanded)
 
-                # Filtrar las soluciones con la heurística mínima
-                min_solutions = [
-                    v for v in agenda if f(v, curr_v, seek, arg) == choosen_heuristic
-                ]
+    def dijkstra(
+        self,
+        start: Vertex[T, Adjacency],
+        seek: Optional[Vertex[T, Adjacency]] = None,
+    ) -> tuple[array, array]:
+        """
+        Caminos mínimos de Dijkstra desde 'start' con montículo binario.
 
-                # Elegir una solución
-                choosen_index = randint(0, len(min_solutions) - 1)
-                choosen_opt = min_solutions[choosen_index]
-                agenda.append(choosen_opt)
+        Los vértices se identifican por su posición en self.vertexs y los costos
+        se acumulan con self.weight_from_adjacency. Con 'seek' la búsqueda
+        termina en cuanto ese vértice sale del montículo (su distancia ya es
+        definitiva); las distancias de los vértices no extraídos son entonces
+        solo cotas superiores.
+
+        Args:
+            start: Vértice origen
+            seek: Vértice objetivo opcional para terminar antes
+
+        Returns:
+            Tupla (distancias, predecesores): array('d') con la distancia de cada
+            vértice (inf si no se alcanzó) y array('i') con el índice del vértice
+            anterior en su camino mínimo (-1 para el origen y los no alcanzados).
+            El camino se obtiene con path_from_predecessors
+
+        Raises:
+            ValueError: Si algún vértice alcanzado no está en self.vertexs
+        """
+        print("Recorrido Dijkstra")
+        index = {id(v): i for i, v in enumerate(self.vertexs)}
+        if id(start) not in index or (seek is not None and id(seek) not in index):
+            raise ValueError("'start' and 'seek' must be in 'vertexs'.")
+
+        n = len(self.vertexs)
+        dist = array("d", [float("inf")]) * n
+        preds = array("i", [-1]) * n
+        source = index[id(start)]
+        target = index[id(seek)] if seek is not None else -1
+
+        dist[source] = 0.0
+        agenda: list[tuple[float, int]] = [(0.0, source)]
+        while agenda:
+            d, curr = heappop(agenda)
+            # Entrada obsoleta: el vértice ya se extrajo con menor distancia
+            if d > dist[curr]:
+                continue
+            if curr == target:
+                break
+
+            for adjacency in self.adjacencies_of(self.vertexs[curr]):
+                neighbor = index.get(id(self.vertex_from_adjacency(adjacency)))
+                if neighbor is None:
+                    raise ValueError("All reached vertices must be in 'vertexs'.")
+
+                new_d = d + self.weight_from_adjacency(adjacency)
+                if new_d < dist[neighbor]:
+                    dist[neighbor] = new_d
+                    preds[neighbor] = curr
+                    heappush(agenda, (new_d, neighbor))
+
+        return (dist, preds)
+
+
+def path_from_predecessors(
+    dist: array, preds: array, target: int
+) -> Optional[list[int]]:
+    """
+    Reconstruye un camino mínimo a partir del resultado de dijkstra.
+
+    Args:
+        dist: Distancias devueltas por dijkstra
+        preds: Predecesores devueltos por dijkstra
+        target: Índice del vértice destino
+
+    Returns:
+        Índices desde el origen hasta 'target', None si no se alcanzó
+    """
+    if dist[target] == float("inf"):
+        return None
+
+    path = [target]
+    while preds[path[-1]] != -1:
+        path.append(preds[path[-1]])
+    path.reverse()
+    return path
+
+
+class HeuristicCache(Generic[T, Adjacency]):
+    """
+    Capa de memorización para heurísticas de búsqueda con expulsión LRU.
+
+    Los valores se guardan por identidad del par (vértice, objetivo), así que la
+    heurística envuelta solo debe depender de esos dos vértices y no de curr_v.
+    Cada entrada conserva una referencia al vértice para que su id no pueda
+    reutilizarse mientras siga en el caché.
+
+    Atributos:
+        heuristic: Heurística original (vecino, actual, objetivo, arg) -> valor
+        maxsize (Optional[int]): Número máximo de entradas, None para no expulsar
+        hits (int): Consultas resueltas desde el caché
+        misses (int): Consultas que evaluaron la heurística
+        evictions (int): Entradas expulsadas por superar maxsize
+    """
+
+    def __init__(
+        self,
+        heuristic: Callable[
+            [Vertex[T, Adjacency], Vertex[T, Adjacency], Vertex[T, Adjacency], Any],
+            float,
+        ],
+        maxsize: Optional[int] = 65536,
+    ) -> None:
+        """
+        Inicializa un caché vacío.
+
+        Args:
+            heuristic: Heurística a memorizar
+            maxsize: Número máximo de entradas antes de expulsar la menos usada
+        """
+        self.heuristic = heuristic
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._values: OrderedDict[
+            tuple[int, int], tuple[Vertex[T, Adjacency], float]
+        ] = OrderedDict()
+
+    def __call__(
+        self,
+        vertex: Vertex[T, Adjacency],
+        curr_v: Vertex[T, Adjacency],
+        seek: Vertex[T, Adjacency],
+        arg: Optional[Any] = None,
+    ) -> float:
+        """
+        Devuelve la heurística de 'vertex' respecto a 'seek', evaluándola solo
+        si no está en el caché.
+        """
+        key = (id(vertex), id(seek))
+        entry = self._values.get(key)
+        if entry is not None:
+            self.hits += 1
+            self._values.move_to_end(key)
+            return entry[1]
+
+        self.misses += 1
+        value = self.heuristic(vertex, curr_v, seek, arg)
+        self._values[key] = (vertex, value)
+        if self.maxsize is not None and len(self._values) > self.maxsize:
+            self._values.popitem(last=False)
+            self.evictions += 1
+        return value
+
+    def hit_rate(self) -> float:
+        """
+        Proporción de consultas resueltas desde el caché.
+
+        Returns:
+            float: hits / (hits + misses), 0.0 si no hubo consultas
+        """
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def clear(self) -> None:
+        """Vacía el caché y reinicia sus contadores."""
+        self._values.clear()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __str__(self) -> str:
+        return (
+            f"{{ hits: {self.hits} misses: {self.misses} "
+            f"evictions: {self.evictions} hit_rate: {self.hit_rate():.2%} }}"
+        )
 
 
 class NonWeightedGraph(Graph[T, NonWeightedVertex[T]]):
@@ -502,6 +1219,103 @@ class NonWeightedGraph(Graph[T, NonWeightedVertex[T]]):
         return adjacency
 
 
+class ImplicitGraph(NonWeightedGraph[T]):
+    """
+    Grafo implícito cuyos vecinos se generan bajo demanda.
+
+    En lugar de construir todos los vértices de antemano, cada estado se
+    expande con una función generadora de sucesores. Los estados deben ser
+    hashables (por ejemplo enteros empaquetados) y se deduplican por hash: un
+    mismo estado siempre corresponde al mismo vértice, por lo que explore,
+    seek, set_lvls, hill_climbing y a_star funcionan sin cambios.
+
+    Atributos:
+        successors (Callable[[T], Iterable[T]]): Genera los estados vecinos de un estado
+    """
+
+    def __init__(
+        self,
+        label: str,
+        successors: Callable[[T], Iterable[T]],
+        predecessors: Optional[Callable[[T], Iterable[T]]] = None,
+    ) -> None:
+        """
+        Inicializa un grafo implícito vacío.
+
+        Args:
+            label: Nombre identificativo del grafo
+            successors: Función que genera los estados vecinos de un estado
+            predecessors: Función que genera los estados desde los que se llega
+                a un estado, necesaria para bidirectional_seek dirigido (en
+                problemas con movimientos reversibles es la misma 'successors')
+        """
+        super().__init__(label)
+        self.successors = successors
+        self.predecessors = predecessors
+        self._by_state: dict[T, NonWeightedVertex[T]] = {}
+
+    def vertex(self, state: T) -> NonWeightedVertex[T]:
+        """
+        Obtiene el vértice único asociado a un estado, creándolo si no existe.
+
+        Args:
+            state: Estado a consultar
+
+        Returns:
+            Vértice que representa al estado
+        """
+        vertex = self._by_state.get(state)
+        if vertex is None:
+            vertex = self._by_state.setdefault(state, NonWeightedVertex(state))
+        return vertex
+
+    def adjacencies_of(
+        self, vertex: Vertex[T, NonWeightedVertex[T]]
+    ) -> list[NonWeightedVertex[T]]:
+        """
+        Genera las adyacencias de un vértice a partir de los sucesores de su estado.
+
+        Args:
+            vertex: Vértice a expandir
+
+        Returns:
+            Lista de vértices vecinos
+        """
+        return [self.vertex(state) for state in self.successors(vertex.value)]
+
+    def predecessors_of(
+        self, vertex: Vertex[T, NonWeightedVertex[T]]
+    ) -> list[Vertex[T, NonWeightedVertex[T]]]:
+        """
+        Genera los predecesores de un vértice con la función 'predecessors'.
+
+        Args:
+            vertex: Vértice del que se quieren los predecesores
+
+        Returns:
+            Lista de vértices predecesores
+
+        Raises:
+            ValueError: Si el grafo se creó sin función 'predecessors'
+        """
+        if self.predecessors is None:
+            raise ValueError("ImplicitGraph needs a 'predecessors' function")
+        return [self.vertex(state) for state in self.predecessors(vertex.value)]
+
+    def size(self) -> int:
+        """
+        Devuelve el número de estados generados hasta el momento.
+
+        Returns:
+            int: Número de vértices materializados
+        """
+        return len(self._by_state)
+
+    def clear(self) -> None:
+        """Libera los vértices generados por búsquedas anteriores."""
+        self._by_state.clear()
+
+
 class WeightedGraph(Graph[T, tuple[WeightedVertex[T], float]]):
     """
     Grafo ponderado donde las adyacencias son tuplas (vértice, peso).
@@ -525,6 +1339,21 @@ class WeightedGraph(Graph[T, tuple[WeightedVertex[T], float]]):
         vertex, _ = adjacency
         return vertex
 
+    def weight_from_adjacency(
+        self, adjacency: tuple[WeightedVertex[T], float]
+    ) -> float:
+        """
+        Obtiene el peso de una adyacencia ponderada.
+
+        Args:
+            adjacency: Tupla (vértice adyacente, peso)
+
+        Returns:
+            Componente peso de la tupla de adyacencia
+        """
+        _, weight = adjacency
+        return weight
+
     def adj_str(self, adjacency: tuple[WeightedVertex[T], float]) -> str:
         """
         Formatea una adyacencia ponderada como '(valor, peso)'.
@@ -0,0 +1,309 @@
+import traceback
+from enum import Enum, auto
+from multiprocessing import Event, Process, Queue
+from queue import Empty
+from random import seed
+from statistics import fmean
+from typing import Any, Callable, Generic, Optional, TypeVar
+
+from algoritmos_geneticos import AlgoritmoGenetico, Pueblerino
+from cromosomas import CromosomaBits, CruzaBits, MutaBits, poblacion_bits_aleatoria
+
+V = TypeVar("V")
+C = TypeVar("C")
+
+
+class RegistroIsla:
+    __slots__ = ("isla", "generacion", "minimo", "media", "maximo")
+
+    def __init__(
+        self, isla: int, generacion: int, minimo: float, media: float, maximo: float
+    ) -> None:
+        self.isla = isla
+        self.generacion = generacion
+        self.minimo = minimo
+        self.media = media
+        self.maximo = maximo
+
+    def __str__(self) -> str:
+        return f"{{ Isla: {self.isla} Generacion: {self.generacion} Min: {self.minimo} Media: {self.media:.3f} Max: {self.maximo} }}"
+
+
+def ejecutar_isla(
+    indice: int,
+    algoritmo: AlgoritmoGenetico[V, C],
+    poblacion: list[Pueblerino[V, C]],
+    seleccion: AlgoritmoGenetico.ModoSeleccion,
+    lim_generaciones: int,
+    intervalo_migracion: int,
+    num_migrantes: int,
+    entradas: list[Any],
+    vecinos: list[int],
+    salida: Any,
+    parar: Any,
+    cerradas: list[Any],
+    semilla: Optional[int],
+) -> None:
+    # Cuerpo de cada proceso: evoluciona su población, envía sus mejores
+    # individuos a las islas vecinas y reporta estadísticas por generación.
+    # Cualquier excepción se reporta al proceso principal en lugar de
+    # terminar sin enviar el mensaje de fin
+    try:
+        evolucionar_isla(
+            indice,
+            algoritmo,
+            poblacion,
+            seleccion,
+            lim_generaciones,
+            intervalo_migracion,
+            num_migrantes,
+            entradas,
+            vecinos,
+            salida,
+            parar,
+            cerradas,
+            semilla,
+        )
+    except Exception:
+        salida.put(("error", indice, traceback.format_exc()))
+    finally:
+        # Avisar a las vecinas que ya no se leerá este buzón
+        cerradas[indice].set()
+
+
+def evolucionar_isla(
+    indice: int,
+    algoritmo: AlgoritmoGenetico[V, C],
+    poblacion: list[Pueblerino[V, C]],
+    seleccion: AlgoritmoGenetico.ModoSeleccion,
+    lim_generaciones: int,
+    intervalo_migracion: int,
+    num_migrantes: int,
+    entradas: list[Any],
+    vecinos: list[int],
+    salida: Any,
+    parar: Any,
+    cerradas: list[Any],
+    semilla: Optional[int],
+) -> None:
+    if semilla is not None:
+        seed(semilla + indice)
+
+    poblacion = algoritmo.evaluar(poblacion)
+    for generacion in range(lim_generaciones):
+        if parar.is_set():
+            break
+
+        poblacion = algoritmo.siguiente_generacion(poblacion, seleccion)
+        aptitudes = [p.fitness for p in poblacion]
+        salida.put(
+            (
+                "registro",
+                RegistroIsla(
+                    indice, generacion, min(aptitudes), fmean(aptitudes), max(aptitudes)
+                ),
+            )
+        )
+
+        if algoritmo.paro(poblacion):
+            parar.set()
+            break
+
+        if (generacion + 1) % intervalo_migracion == 0:
+            mejores = sorted(poblacion, key=lambda p: p.fitness, reverse=True)
+            for vecino in vecinos:
+                # Una isla que ya terminó no leería a sus migrantes
+                if not cerradas[vecino].is_set():
+                    entradas[vecino].put(mejores[:num_migrantes])
+
+            # Los migrantes que hayan llegado reemplazan a los peores
+            migrantes: list[Pueblerino[V, C]] = []
+            while True:
+                try:
+                    migrantes.extend(entradas[indice].get_nowait())
+                except Empty:
+                    break
+            if migrantes:
+                poblacion.sort(key=lambda p: p.fitness)
+                reemplazos = min(len(migrantes), len(poblacion))
+                poblacion[:reemplazos] = migrantes[:reemplazos]
+
+    salida.put(("fin", indice, poblacion))
+
+
+class ModeloIslas(Generic[V, C]):
+    """
+    Modelo de islas: N poblaciones independientes evolucionan en procesos
+    separados con el mismo AlgoritmoGenetico y cada 'intervalo_migracion'
+    generaciones envían sus mejores individuos a sus islas vecinas.
+
+    Las funciones de cruza, muta, paro y fitness del algoritmo se envían a cada
+    proceso, por lo que deben poder serializarse con pickle (definidas a nivel
+    de módulo). Si una isla falla, las demás se detienen y ejecutar lanza un
+    RuntimeError con el traceback de la isla.
+    """
+
+    # Segundos entre revisiones del estado de los procesos mientras se espera
+    SONDEO = 0.5
+
+    class Topologia(Enum):
+        ANILLO = auto()  # La isla i envía a la isla i + 1
+        COMPLETA = auto()  # Cada isla envía a todas las demás
+
+    def __init__(
+        self,
+        algoritmo: AlgoritmoGenetico[V, C],
+        topologia: Topologia = Topologia.ANILLO,
+        intervalo_migracion: int = 5,
+        num_migrantes: int = 1,
+        semilla: Optional[int] = None,
+    ) -> None:
+        if intervalo_migracion <= 0 or num_migrantes < 0:
+            raise ValueError("El intervalo y los migrantes deben ser positivos")
+
+        self.algoritmo = algoritmo
+        self.topologia = topologia
+        self.intervalo_migracion = intervalo_migracion
+        self.num_migrantes = num_migrantes
+        self.semilla = semilla
+
+    def vecinos(self, indice: int, num_islas: int) -> list[int]:
+        if num_islas == 1:
+            return []
+        if self.topologia == self.Topologia.ANILLO:
+            return [(indice + 1) % num_islas]
+        return [i for i in range(num_islas) if i != indice]
+
+    def ejecutar(
+        self,
+        poblaciones: list[list[Pueblerino[V, C]]],
+        seleccion: AlgoritmoGenetico.ModoSeleccion,
+        lim_generaciones: int,
+        # Se llama en el proceso principal por cada registro que llega
+        al_registrar: Optional[Callable[[RegistroIsla], None]] = None,
+    ) -> tuple[Pueblerino[V, C], list[RegistroIsla], list[list[Pueblerino[V, C]]]]:
+        num_islas = len(poblaciones)
+        if num_islas == 0:
+            raise ValueError("Se necesita al menos una población")
+
+        entradas = [Queue() for _ in range(num_islas)]
+        salida: Any = Queue()
+        parar = Event()
+        cerradas = [Event() for _ in range(num_islas)]
+
+        procesos = [
+            Process(
+                target=ejecutar_isla,
+                args=(
+                    i,
+                    self.algoritmo,
+                    poblaciones[i],
+                    seleccion,
+                    lim_generaciones,
+                    self.intervalo_migracion,
+                    self.num_migrantes,
+                    entradas,
+                    self.vecinos(i, num_islas),
+                    salida,
+                    parar,
+                    cerradas,
+                    self.semilla,
+                ),
+            )
+            for i in range(num_islas)
+        ]
+        for proceso in procesos:
+            proceso.start()
+
+        registros: list[RegistroIsla] = []
+        finales: list[list[Pueblerino[V, C]]] = [[] for _ in range(num_islas)]
+        terminadas: set[int] = set()
+        errores: list[str] = []
+        while len(terminadas) < num_islas:
+            try:
+                mensaje = salida.get(timeout=self.SONDEO)
+            except Empty:
+                # Un proceso que murió sin reportar (por ejemplo, al no poder
+                # deserializar sus argumentos) nunca enviará su mensaje de fin
+                for i, proceso in enumerate(procesos):
+                    if i not in terminadas and proceso.exitcode not in (None, 0):
+                        errores.append(
+                            f"La isla {i} terminó con código {proceso.exitcode}"
+                        )
+                        terminadas.add(i)
+                        parar.set()
+                continue
+
+            if mensaje[0] == "registro":
+                registros.append(mensaje[1])
+                if al_registrar is not None:
+                    al_registrar(mensaje[1])
+            elif mensaje[0] == "error":
+                _, indice, detalle = mensaje
+                errores.append(f"La isla {indice} falló:\n{detalle}")
+                terminadas.add(indice)
+                parar.set()
+            else:
+                _, indice, poblacion = mensaje
+                finales[indice] = poblacion
+                terminadas.add(indice)
+
+        # Un proceso no termina hasta escribir en el pipe todo lo que envió;
+        # si el buzón destino está lleno, solo se libera leyéndolo, así que se
+        # vacían los buzones mientras se espera a cada proceso
+        for proceso in procesos:
+            while True:
+                for entrada in entradas:
+                    while True:
+                        try:
+                            entrada.get_nowait()
+                        except Empty:
+                            break
+                proceso.join(timeout=self.SONDEO)
+                if proceso.exitcode is not None:
+                    break
+
+        if errores:
+            raise RuntimeError("\n".join(errores))
+
+        mejor = max(
+            (p for poblacion in finales for p in poblacion), key=lambda p: p.fitness
+        )
+        return (mejor, registros, finales)
+
+
+BITS_EJEMPLO = 16
+
+
+# Operadores del ejemplo a nivel de módulo para que los procesos puedan
+# importarlos al deserializar el algoritmo (necesario con el método 'spawn')
+def fitness_ejemplo(valor: int) -> float:
+    return float(valor)
+
+
+def paro_ejemplo(poblacion: list[Pueblerino[int, CromosomaBits]]) -> bool:
+    return any(p.fitness == 2**BITS_EJEMPLO - 1 for p in poblacion)
+
+
+if __name__ == "__main__":
+    algoritmo: AlgoritmoGenetico[int, CromosomaBits] = AlgoritmoGenetico(
+        cruza=CruzaBits(),
+        muta=MutaBits(probabilidad_muta=0.1),
+        paro=paro_ejemplo,
+        fitness=fitness_ejemplo,
+    )
+    modelo = ModeloIslas(
+        algoritmo,
+        topologia=ModeloIslas.Topologia.ANILLO,
+        intervalo_migracion=3,
+        num_migrantes=2,
+        semilla=0,
+    )
+    mejor, registros, _ = modelo.ejecutar(
+        poblaciones=[poblacion_bits_aleatoria(20, BITS_EJEMPLO) for _ in range(4)],
+        seleccion=AlgoritmoGenetico.ModoSeleccion.RANGOS,
+        lim_generaciones=200,
+        al_registrar=lambda r: print(r) if r.generacion % 10 == 0 else None,
+    )
+    print(f"Mejor: {mejor}")
+    print(f"Registros: {len(registros)}")
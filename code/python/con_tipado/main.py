@@ -1,7 +1,9 @@
+from itertools import islice
 from typing import Any, Optional
 
-from graph import Graph, NonWeightedGraph
-from nodes import NonWeightedVertex
+from graph import Graph, HeuristicCache, ImplicitGraph, NonWeightedGraph, WeightedGraph
+from nodes import NonWeightedVertex, WeightedVertex
+from puzzle import manhattan, pack_board, puzzle_successors, unpack_board
 
 if __name__ == "__main__":
     seek = NonWeightedVertex([[2, 3, 8], [1, 4, 5], [7, 0, 6]])
@@ -136,6 +138,7 @@ if __name__ == "__main__":
     action(v36, v36, [1])
 
     steps = [0]
+    cache = HeuristicCache(heuristic)
     steps = arbol.hill_climbing(
         start=v1,
         seek=v36,
@@ -143,9 +146,11 @@ if __name__ == "__main__":
         action=action,
         objective=Graph.Objective.MINIMIZE,
         arg=steps,
+        cache=cache,
     )
 
     print(f"Vertices recorridos: {steps}")
+    print(f"Caché heurística: {cache}")
 
     arbol.explore(
         start=v1,
@@ -167,3 +172,87 @@ if __name__ == "__main__":
         algorithm=Graph.Algorithm.DFS,
         direction=Graph.Direction.LEFT,
     )
+
+    # Mismo puzzle como grafo implícito: los estados se generan al expandirlos
+    # Los movimientos del hueco son reversibles: los predecesores de un estado
+    # son sus mismos sucesores
+    puzzle = ImplicitGraph(
+        "Puzzle implícito", puzzle_successors(3), predecessors=puzzle_successors(3)
+    )
+    inicio = puzzle.vertex(pack_board(v1.value))
+    objetivo = puzzle.vertex(pack_board(v36.value))
+
+    def contar(_v, arg) -> tuple[bool, Optional[Any]]:
+        arg[0] += 1
+        return (False, None)
+
+    alcanzables = [0]
+    puzzle.explore(
+        start=inicio,
+        algorithm=Graph.Algorithm.BFS,
+        action=contar,
+        arg=alcanzables,
+    )
+    print(f"Estados alcanzables: {alcanzables[0]}")
+
+    # La misma heurística sirve para a_star e ida_star
+    def distancia_manhattan(adj, _curr_v, seek, _arg) -> float:
+        return manhattan(adj.value, seek.value)
+
+    resultado = puzzle.a_star(
+        start=inicio,
+        seek=objetivo,
+        heuristic=distancia_manhattan,
+    )
+    assert resultado is not None
+    camino, costo = resultado
+    print(f"Movimientos: {costo:.0f}")
+    for paso in camino:
+        for row in unpack_board(paso.value):
+            print(row)
+        print()
+
+    camino_bidireccional = puzzle.bidirectional_seek(inicio, objetivo)
+    assert camino_bidireccional is not None
+    print(f"Movimientos (bidireccional): {len(camino_bidireccional) - 1}")
+
+    expandidos: list[int] = []
+    resultado = puzzle.ida_star(
+        start=inicio,
+        seek=objetivo,
+        heuristic=distancia_manhattan,
+        expansions=expandidos,
+    )
+    assert resultado is not None
+    print(
+        f"Movimientos (IDA*): {resultado[1]:.0f} Expandidos por iteración: {expandidos}"
+    )
+
+    # Recorrido perezoso: solo se expanden los estados necesarios para los
+    # primeros 5 con profundidad 4
+    profundidad_4 = (
+        v
+        for v, profundidad, _padre in puzzle.iter_explore(
+            inicio, Graph.Algorithm.BFS, details=True
+        )
+        if profundidad == 4
+    )
+    print(
+        f"Primeros estados a profundidad 4: {[v.value for v in islice(profundidad_4, 5)]}"
+    )
+
+    # En un grafo ponderado IDDFS cuenta aristas, no pesos: 'c' está a
+    # profundidad 1 aunque la arista cueste 2.5, mientras que IDA* minimiza
+    # el costo y prefiere a -> b -> c (1.5 + 0.5)
+    a, b, c = WeightedVertex("a"), WeightedVertex("b"), WeightedVertex("c")
+    a.append((b, 1.5))
+    a.append((c, 2.5))
+    b.append((c, 0.5))
+    ponderado = WeightedGraph("Ponderado", [a, b, c])
+    profundidad_c = ponderado.iterative_deepening(
+        a, action=lambda v, arg: (v is c, arg[0]), arg=["c encontrado"]
+    )
+    print(f"IDDFS ponderado: {profundidad_c}")
+    resultado = ponderado.ida_star(a, c, lambda _adj, _curr_v, _seek, _arg: 0.0)
+    assert resultado is not None
+    print(f"IDA* ponderado: {[v.value for v in resultado[0]]} costo {resultado[1]}")
@@ -11,8 +11,12 @@ class Node(Generic[T], ABC):
 
     Attributes:
         value (T): El valor almacenado en el nodo.
+        label (Optional[str]): Etiqueta opcional del nodo.
     """
 
+    # Sin __dict__ por instancia: Generic y ABC también definen __slots__ vacíos
+    __slots__ = ("value", "label")
+
     def __init__(self, value: T, label: Optional[str] = None) -> None:
         """
         Inicializa un nodo con un valor dado.
@@ -46,6 +50,8 @@ class Vertex(Node[T], Generic[T, Adjacency], ABC):
         visited (bool): Indica si el vértice ha sido visitado.
     """
 
+    __slots__ = ("adjacencies", "lvl", "visited")
+
     def __init__(
         self,
         value: T,
@@ -113,6 +119,8 @@ class DoubleLinkedNode(Node[T]):
         prev (Optional[DoubleLinkedNode]): Referencia al nodo anterior.
     """
 
+    __slots__ = ("next", "prev")
+
     def __init__(
         self,
         value: T,
@@ -140,6 +148,8 @@ class NonWeightedVertex(Vertex[T, "NonWeightedVertex[T]"]):
         adjacencies (list[NonWeightedVertex[T]]): Lista de vértices adyacentes.
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         value: T,
@@ -165,6 +175,8 @@ class WeightedVertex(Vertex[T, tuple["WeightedVertex[T]", float]]):
         adjacencies (list[tuple[WeightedVertex[T], float]]): Lista de adyacencias con pesos asociados.
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         value: T,
@@ -1,5 +1,6 @@
 # Perceptron
 from random import random
+from time import perf_counter
 from typing import Callable, Optional
 
 
@@ -18,6 +19,46 @@ def evaluar_neurona_perceptron(
     return f(acumulado)
 
 
+class HistorialPerceptron:
+    """
+    Métricas por iteración (época) de aprendizaje_perceptron: entradas mal
+    clasificadas, modificaciones reales de pesos/umbral y segundos.
+    """
+
+    def __init__(self) -> None:
+        self.errores: list[int] = []
+        self.actualizaciones: list[int] = []
+        self.tiempos: list[float] = []
+        self.convergio = False
+
+    def registrar(self, errores: int, actualizaciones: int, tiempo: float) -> None:
+        self.errores.append(errores)
+        self.actualizaciones.append(actualizaciones)
+        self.tiempos.append(tiempo)
+
+    def __len__(self) -> int:
+        return len(self.errores)
+
+    def __str__(self) -> str:
+        return f"{{ Iteraciones: {len(self)} Errores: {self.errores} Convergio: {self.convergio} Tiempo: {sum(self.tiempos):.6f} s }}"
+
+
+def sin_mejora(paciencia: int) -> Callable[[HistorialPerceptron], bool]:
+    # Regla de parada temprana: se detiene si en las últimas 'paciencia'
+    # iteraciones no se bajó el mínimo de errores alcanzado antes
+    if paciencia <= 0:
+        raise ValueError("La paciencia debe ser un entero positivo")
+
+    def parar(historial: HistorialPerceptron) -> bool:
+        if len(historial) <= paciencia:
+            return False
+        return min(historial.errores[-paciencia:]) >= min(
+            historial.errores[:-paciencia]
+        )
+
+    return parar
+
+
 def aprendizaje_perceptron(
     modificacion_peso: Callable[
         [
@@ -43,20 +84,29 @@ def aprendizaje_perceptron(
     pesos: Optional[list[float]] = None,
     umbral_inicial: Optional[float] = None,
     lim_iteraciones: Optional[int] = None,
-) -> tuple[list[float], float]:
+    # Con False no se imprime nada, solo se llenan las métricas del historial
+    verboso: bool = True,
+    # Se llama al terminar cada iteración; si regresa True se detiene
+    parada_temprana: Optional[Callable[[HistorialPerceptron], bool]] = None,
+) -> tuple[list[float], float, HistorialPerceptron]:
     if pesos == None:
         nums_a_generar = len(entradas[0])
         pesos = [random() for i in range(nums_a_generar)]
 
     umbral: float = random() if umbral_inicial == None else umbral_inicial
 
+    historial = HistorialPerceptron()
     iteraciones = 0
     continuar = True
     while continuar and (lim_iteraciones == None or iteraciones < lim_iteraciones):
         iteraciones += 1
         continuar = False
+        errores = 0
+        actualizaciones = 0
+        inicio = perf_counter()
 
-        print(f"-------- Iteracion {iteraciones} ---------")
+        if verboso:
+            print(f"-------- Iteracion {iteraciones} ---------")
         for i in range(len(entradas)):
             resultado = evaluar_neurona_perceptron(
                 entrada=entradas[i],
@@ -65,14 +115,17 @@ def aprendizaje_perceptron(
                 umbral=umbral,
             )
 
-            print(f"Entrada {i+1} {entradas[i]}")
-            print(f"Pesos: {pesos}")
-            print(f"Umbral: {umbral}")
-            print(f"Resultado: {resultado}")
-            print(f"Resultado esperado {salidas_esperadas[i]}")
-            print()
+            if verboso:
+                print(f"Entrada {i+1} {entradas[i]}")
+                print(f"Pesos: {pesos}")
+                print(f"Umbral: {umbral}")
+                print(f"Resultado: {resultado}")
+                print(f"Resultado esperado {salidas_esperadas[i]}")
+                print()
 
             if resultado != salidas_esperadas[i]:
+                errores += 1
+                pesos_anteriores, umbral_anterior = pesos, umbral
                 pesos = [
                     modificacion_peso(
                         entradas[i][j],
@@ -83,80 +136,96 @@ def aprendizaje_perceptron(
                     )
                     for j in range(len(entradas[i]))
                 ]
-                print(
-                    f"umbral {umbral} resultado {resultado} salida esperada {salidas_esperadas[i]}"
-                )
+                if verboso:
+                    print(
+                        f"umbral {umbral} resultado {resultado} salida esperada {salidas_esperadas[i]}"
+                    )
                 umbral = modificacion_umbral(umbral, resultado, salidas_esperadas[i])
                 continuar = True
+                if pesos != pesos_anteriores or umbral != umbral_anterior:
+                    actualizaciones += 1
 
-                print(f"Modificacion iteracion {iteraciones} entrada {i + 1}")
-                print(f"Pesos: {pesos}")
-                print(f"Umbral: {umbral}")
-                print()
-            else:
+                if verboso:
+                    print(f"Modificacion iteracion {iteraciones} entrada {i + 1}")
+                    print(f"Pesos: {pesos}")
+                    print(f"Umbral: {umbral}")
+                    print()
+            elif verboso:
                 print("No se modifica ningun valor")
                 print()
-        print(f"------------------------------------------")
-    return (pesos, umbral)
+        if verboso:
+            print(f"------------------------------------------")
 
+        historial.registrar(errores, actualizaciones, perf_counter() - inicio)
+        if parada_temprana is not None and parada_temprana(historial):
+            break
 
-print("----- PUERTA LOGICA AND ------")
-pesos, umbral = aprendizaje_perceptron(
-    entradas=[
-        [-1.0, -1.0],  # F and F
-        [+1.0, -1.0],  # F and V
-        [-1.0, +1.0],  # V and F
-        [+1.0, +1.0],  # V and V
-    ],
-    salidas_esperadas=[-1.0, -1.0, -1.0, +1.0],  # F  # F  # F  # V
-    pesos=[1.0, 1.0],
-    f=lambda x: 1 if x > 0 else -1,
-    modificacion_peso=(
-        lambda entrada_actual, peso_actual, umbral_actual, resultado_actual, salida_esperada: peso_actual
-        + (salida_esperada * entrada_actual)
-    ),
-    modificacion_umbral=(
-        lambda umbral_actual, resultado, salida_esperada: umbral_actual
-        + salida_esperada
-    ),
-)
-print(f"Pesos finales: {pesos}")
-print(f"Umbral final: {umbral}")
-
-print("----- PROBLEMA ASISTENCIAs ------")
-pesos, umbral = aprendizaje_perceptron(
-    entradas=[
-        # Horas, asistencia
-        [+2.0, -1.0],
-        [+3.0, +1.0],
-        [-4.0, +1.0],
-        [+1.0, -1.0],
-        [+5.0, +1.0],
-        [+6.0, +1.0],
-        [+3.0, -1.0],
-        [+4.0, -1.0],
-    ],
-    salidas_esperadas=[
-        # aprueba
-        -1.0,
-        +1.0,
-        +1.0,
-        -1.0,
-        +1.0,
-        +1.0,
-        -1.0,
-        -1.0,
-    ],
-    pesos=[1.0, 1.0],
-    f=lambda x: 1 if x > 0 else -1,
-    modificacion_peso=(
-        lambda entrada_actual, peso_actual, umbral_actual, resultado_actual, salida_esperada: peso_actual
-        + (salida_esperada * entrada_actual)
-    ),
-    modificacion_umbral=(
-        lambda umbral_actual, resultado, salida_esperada: umbral_actual
-        + salida_esperada
-    ),
-)
-print(f"Pesos finales: {pesos}")
-print(f"Umbral final: {umbral}")
+    historial.convergio = not continuar
+    return (pesos, umbral, historial)
+
+
+if __name__ == "__main__":
+    print("----- PUERTA LOGICA AND ------")
+    pesos, umbral, historial = aprendizaje_perceptron(
+        entradas=[
+            [-1.0, -1.0],  # F and F
+            [+1.0, -1.0],  # F and V
+            [-1.0, +1.0],  # V and F
+            [+1.0, +1.0],  # V and V
+        ],
+        salidas_esperadas=[-1.0, -1.0, -1.0, +1.0],  # F  # F  # F  # V
+        pesos=[1.0, 1.0],
+        f=lambda x: 1 if x > 0 else -1,
+        modificacion_peso=(
+            lambda entrada_actual, peso_actual, umbral_actual, resultado_actual, salida_esperada: peso_actual
+            + (salida_esperada * entrada_actual)
+        ),
+        modificacion_umbral=(
+            lambda umbral_actual, resultado, salida_esperada: umbral_actual
+            + salida_esperada
+        ),
+    )
+    print(f"Pesos finales: {pesos}")
+    print(f"Umbral final: {umbral}")
+    print(f"Historial: {historial}")
+
+    print("----- PROBLEMA ASISTENCIAs ------")
+    pesos, umbral, historial = aprendizaje_perceptron(
+        entradas=[
+            # Horas, asistencia
+            [+2.0, -1.0],
+            [+3.0, +1.0],
+            [-4.0, +1.0],
+            [+1.0, -1.0],
+            [+5.0, +1.0],
+            [+6.0, +1.0],
+            [+3.0, -1.0],
+            [+4.0, -1.0],
+        ],
+        salidas_esperadas=[
+            # aprueba
+            -1.0,
+            +1.0,
+            +1.0,
+            -1.0,
+            +1.0,
+            +1.0,
+            -1.0,
+            -1.0,
+        ],
+        pesos=[1.0, 1.0],
+        f=lambda x: 1 if x > 0 else -1,
+        verboso=False,
+        parada_temprana=sin_mejora(paciencia=5),
+        modificacion_peso=(
+            lambda entrada_actual, peso_actual, umbral_actual, resultado_actual, salida_esperada: peso_actual
+            + (salida_esperada * entrada_actual)
+        ),
+        modificacion_umbral=(
+            lambda umbral_actual, resultado, salida_esperada: umbral_actual
+            + salida_esperada
+        ),
+    )
+    print(f"Pesos finales: {pesos}")
+    print(f"Umbral final: {umbral}")
+    print(f"Historial: {historial}")
@@ -0,0 +1,346 @@
+# Perceptron con NumPy
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Iterator, Optional, Sequence, Union
+
+import numpy as np
+
+
+def signo(netas: np.ndarray) -> np.ndarray:
+    # Misma activación que los ejemplos de perceptron.py: 1 si x > 0, si no -1
+    return np.where(netas > 0, 1.0, -1.0)
+
+
+def netas_perceptron(
+    entradas: np.ndarray, pesos: np.ndarray, umbral: float
+) -> np.ndarray:
+    # evaluar_neurona_perceptron suma (x_i * w_i + umbral) por cada entrada,
+    # es decir x·w + n * umbral; se conserva la misma fórmula
+    return entradas @ pesos + entradas.shape[-1] * umbral
+
+
+def evaluar_lote_perceptron(
+    # Matriz (ndarray o lista de filas, como en perceptron.py) con una fila por
+    # entrada, o un iterador/generador de matrices (bloques) para evaluar datos
+    # que no caben completos en memoria
+    entradas: Union[np.ndarray, Sequence[Sequence[float]], Iterator[Any]],
+    pesos: np.ndarray,
+    umbral: float,
+    f: Callable[[np.ndarray], np.ndarray] = signo,
+) -> np.ndarray:
+    """
+    Equivalente por lotes de evaluar_neurona_perceptron: regresa la salida de
+    la neurona para cada fila de 'entradas' en un solo arreglo.
+    """
+    pesos = np.asarray(pesos)
+    if isinstance(entradas, Iterator):
+        salidas = [
+            evaluar_lote_perceptron(bloque, pesos, umbral, f) for bloque in entradas
+        ]
+        if not salidas:
+            return np.empty(0)
+        return np.concatenate(salidas)
+
+    # Los arreglos de punto flotante (por ejemplo float32) se usan sin copiar
+    if not (
+        isinstance(entradas, np.ndarray) and np.issubdtype(entradas.dtype, np.floating)
+    ):
+        entradas = np.asarray(entradas, dtype=float)
+    if entradas.ndim != 2 or entradas.shape[1] != pesos.shape[0]:
+        raise ValueError("'entradas' debe tener una columna por peso")
+    return f(netas_perceptron(entradas, pesos, umbral))
+
+
+def entrenar_perceptron(
+    entradas: np.ndarray,
+    salidas_esperadas: np.ndarray,
+    pesos: Optional[np.ndarray] = None,
+    umbral_inicial: Optional[float] = None,
+    lim_iteraciones: Optional[int] = None,
+    # None: regla en línea (una muestra a la vez, como aprendizaje_perceptron);
+    # un entero: se corrige con la suma de los errores de cada mini-lote
+    tamanio_lote: Optional[int] = None,
+    tasa: float = 1.0,
+    f: Callable[[np.ndarray], np.ndarray] = signo,
+    semilla: Optional[int] = None,
+) -> tuple[np.ndarray, float]:
+    """
+    Entrena un perceptrón sobre la matriz de entradas completa (una fila por
+    muestra) con la regla w += tasa * esperada * x y umbral += tasa * esperada
+    para cada muestra mal clasificada, la misma de los ejemplos de perceptron.py.
+
+    Las activaciones se calculan como un producto matriz-vector por bloque de
+    muestras. En modo en línea el resultado es idéntico a aprendizaje_perceptron:
+    se evalúa un bloque con los pesos actuales, se corrige la primera muestra
+    mal clasificada y se continúa desde la siguiente.
+
+    Termina cuando una iteración completa no modifica los pesos o al llegar a
+    lim_iteraciones. Regresa (pesos, umbral).
+    """
+    if entradas.ndim != 2 or entradas.shape[0] != salidas_esperadas.shape[0]:
+        raise ValueError("'entradas' debe ser una matriz con una fila por salida")
+    if tamanio_lote is not None and tamanio_lote <= 0:
+        raise ValueError("El tamaño de lote debe ser un entero positivo")
+
+    # Los pesos siguen el tipo de las entradas para no copiar la matriz en cada
+    # producto (ej. entradas float32 de gran tamaño)
+    tipo = entradas.dtype if np.issubdtype(entradas.dtype, np.floating) else np.float64
+    rng = np.random.default_rng(semilla)
+    pesos = (
+        rng.random(entradas.shape[1]).astype(tipo)
+        if pesos is None
+        else np.array(pesos, dtype=tipo)
+    )
+    umbral = float(rng.random()) if umbral_inicial is None else umbral_inicial
+    esperadas = np.asarray(salidas_esperadas, dtype=tipo)
+
+    iteraciones = 0
+    continuar = True
+    while continuar and (lim_iteraciones is None or iteraciones < lim_iteraciones):
+        iteraciones += 1
+        if tamanio_lote is None:
+            pesos, umbral, continuar = _iteracion_en_linea(
+                entradas, esperadas, pesos, umbral, tasa, f
+            )
+        else:
+            pesos, umbral, continuar = _iteracion_mini_lotes(
+                entradas, esperadas, pesos, umbral, tasa, f, tamanio_lote
+            )
+
+    return (pesos, umbral)
+
+
+def _iteracion_en_linea(
+    entradas: np.ndarray,
+    esperadas: np.ndarray,
+    pesos: np.ndarray,
+    umbral: float,
+    tasa: float,
+    f: Callable[[np.ndarray], np.ndarray],
+) -> tuple[np.ndarray, float, bool]:
+    # El bloque crece mientras no haya errores y se reduce al encontrar uno,
+    # así se desperdicia poco cálculo cuando los errores son frecuentes
+    n = entradas.shape[0]
+    bloque = 64
+    modificado = False
+    i = 0
+    while i < n:
+        fin = min(i + bloque, n)
+        resultados = f(netas_perceptron(entradas[i:fin], pesos, umbral))
+        errores = np.flatnonzero(resultados != esperadas[i:fin])
+        if errores.size == 0:
+            i = fin
+            bloque = min(bloque * 2, 65536)
+            continue
+
+        j = i + int(errores[0])
+        pesos += (tasa * esperadas[j]) * entradas[j]
+        umbral += tasa * float(esperadas[j])
+        modificado = True
+        i = j + 1
+        bloque = max(bloque // 2, 1)
+
+    return (pesos, umbral, modificado)
+
+
+def _iteracion_mini_lotes(
+    entradas: np.ndarray,
+    esperadas: np.ndarray,
+    pesos: np.ndarray,
+    umbral: float,
+    tasa: float,
+    f: Callable[[np.ndarray], np.ndarray],
+    tamanio_lote: int,
+) -> tuple[np.ndarray, float, bool]:
+    modificado = False
+    for i in range(0, entradas.shape[0], tamanio_lote):
+        lote = entradas[i : i + tamanio_lote]
+        esperadas_lote = esperadas[i : i + tamanio_lote]
+        errores = f(netas_perceptron(lote, pesos, umbral)) != esperadas_lote
+        if not errores.any():
+            continue
+
+        correcciones = esperadas_lote[errores]
+        pesos += tasa * (correcciones @ lote[errores])
+        umbral += tasa * float(correcciones.sum())
+        modificado = True
+
+    return (pesos, umbral, modificado)
+
+
+def uno_contra_resto(etiquetas: np.ndarray, num_clases: int) -> np.ndarray:
+    # Matriz (n, num_clases) con +1 en la columna de la clase de cada muestra
+    # y -1 en las demás, para entrenar una cabeza por clase
+    salidas = np.full((etiquetas.shape[0], num_clases), -1.0)
+    salidas[np.arange(etiquetas.shape[0]), etiquetas] = 1.0
+    return salidas
+
+
+def predecir_clase(
+    entradas: np.ndarray, pesos: np.ndarray, umbrales: np.ndarray
+) -> np.ndarray:
+    # La clase es la cabeza con mayor neta
+    return np.argmax(netas_perceptron(entradas, pesos, umbrales), axis=1)
+
+
+def entrenar_perceptron_multiple(
+    entradas: np.ndarray,
+    # Matriz (n, k): una columna de salidas esperadas por cabeza
+    salidas_esperadas: np.ndarray,
+    pesos: Optional[np.ndarray] = None,
+    umbrales_iniciales: Optional[np.ndarray] = None,
+    lim_iteraciones: Optional[int] = None,
+    # Con 1 cada cabeza sigue la regla en línea de aprendizaje_perceptron
+    tamanio_lote: int = 256,
+    tasa: float = 1.0,
+    f: Callable[[np.ndarray], np.ndarray] = signo,
+    # Reparte las cabezas en grupos de columnas entre un pool de hilos
+    hilos: Optional[int] = None,
+    semilla: Optional[int] = None,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Entrena k perceptrones sobre las mismas entradas con una matriz de pesos
+    (d, k) y un vector de umbrales (k,). Cada lote se lee una vez para todas
+    las cabezas: las netas son un producto matriz-matriz y cada cabeza se
+    corrige solo con las muestras que clasificó mal.
+
+    Las cabezas son independientes, así que con 'hilos' cada hilo entrena un
+    grupo de columnas (NumPy libera el GIL durante los productos). Regresa
+    (pesos, umbrales).
+    """
+    if salidas_esperadas.ndim != 2 or entradas.shape[0] != salidas_esperadas.shape[0]:
+        raise ValueError(
+            "'salidas_esperadas' debe ser una matriz con una fila por entrada"
+        )
+    if tamanio_lote <= 0:
+        raise ValueError("El tamaño de lote debe ser un entero positivo")
+
+    tipo = entradas.dtype if np.issubdtype(entradas.dtype, np.floating) else np.float64
+    rng = np.random.default_rng(semilla)
+    forma = (entradas.shape[1], salidas_esperadas.shape[1])
+    pesos = (
+        rng.random(forma).astype(tipo) if pesos is None else np.array(pesos, dtype=tipo)
+    )
+    umbrales = (
+        rng.random(forma[1])
+        if umbrales_iniciales is None
+        else np.array(umbrales_iniciales, dtype=np.float64)
+    )
+    esperadas = np.asarray(salidas_esperadas, dtype=tipo)
+
+    num_grupos = 1 if hilos is None else min(hilos, forma[1])
+    grupos = [g for g in np.array_split(np.arange(forma[1]), num_grupos) if g.size]
+    columnas = [slice(int(g[0]), int(g[-1]) + 1) for g in grupos]
+
+    def entrenar_grupo(cols: slice) -> None:
+        # Las vistas pesos[:, cols] y umbrales[cols] se modifican en su lugar;
+        # cada grupo toca columnas distintas
+        iteraciones = 0
+        continuar = True
+        while continuar and (lim_iteraciones is None or iteraciones < lim_iteraciones):
+            iteraciones += 1
+            continuar = _iteracion_multiple(
+                entradas,
+                esperadas[:, cols],
+                pesos[:, cols],
+                umbrales[cols],
+                tasa,
+                f,
+                tamanio_lote,
+            )
+
+    if len(columnas) == 1:
+        entrenar_grupo(columnas[0])
+    else:
+        with ThreadPoolExecutor(max_workers=len(columnas)) as pool:
+            list(pool.map(entrenar_grupo, columnas))
+
+    return (pesos, umbrales)
+
+
+def _iteracion_multiple(
+    entradas: np.ndarray,
+    esperadas: np.ndarray,
+    pesos: np.ndarray,
+    umbrales: np.ndarray,
+    tasa: float,
+    f: Callable[[np.ndarray], np.ndarray],
+    tamanio_lote: int,
+) -> bool:
+    modificado = False
+    for i in range(0, entradas.shape[0], tamanio_lote):
+        lote = entradas[i : i + tamanio_lote]
+        esperadas_lote = esperadas[i : i + tamanio_lote]
+        netas = lote @ pesos + lote.shape[1] * umbrales
+        # Corrección por muestra y cabeza: la salida esperada donde hubo error
+        correcciones = np.where(f(netas) != esperadas_lote, esperadas_lote, 0)
+        if not correcciones.any():
+            continue
+
+        pesos += tasa * (lote.T @ correcciones)
+        umbrales += tasa * correcciones.sum(axis=0)
+        modificado = True
+
+    return modificado
+
+
+if __name__ == "__main__":
+    from time import perf_counter
+
+    print("----- PUERTA LOGICA AND ------")
+    pesos, umbral = entrenar_perceptron(
+        entradas=np.array([[-1.0, -1.0], [+1.0, -1.0], [-1.0, +1.0], [+1.0, +1.0]]),
+        salidas_esperadas=np.array([-1.0, -1.0, -1.0, +1.0]),
+        pesos=np.array([1.0, 1.0]),
+    )
+    print(f"Pesos finales: {pesos}")
+    print(f"Umbral final: {umbral}")
+
+    # Datos linealmente separables: la etiqueta es el signo de un hiperplano
+    rng = np.random.default_rng(0)
+    # 10^6 x 1000 en float32 ocupa 4 GB; se reduce para el ejemplo
+    muestras, caracteristicas = 200_000, 1000
+    entradas = rng.standard_normal((muestras, caracteristicas), dtype=np.float32)
+    hiperplano = rng.standard_normal(caracteristicas, dtype=np.float32)
+    salidas = signo(entradas @ hiperplano).astype(np.float32)
+
+    for nombre, tamanio_lote in (("En línea", None), ("Mini-lotes", 256)):
+        inicio = perf_counter()
+        pesos, umbral = entrenar_perceptron(
+            entradas, salidas, tamanio_lote=tamanio_lote, lim_iteraciones=3, semilla=0
+        )
+        tiempo = perf_counter() - inicio
+        aciertos = np.mean(evaluar_lote_perceptron(entradas, pesos, umbral) == salidas)
+        print(f"{nombre}: {tiempo:.2f} s, exactitud {aciertos:.2%}")
+
+    print("----- PUERTAS AND Y OR EN UNA PASADA ------")
+    pesos, umbrales = entrenar_perceptron_multiple(
+        entradas=np.array([[-1.0, -1.0], [+1.0, -1.0], [-1.0, +1.0], [+1.0, +1.0]]),
+        salidas_esperadas=np.array(
+            [[-1.0, -1.0], [-1.0, +1.0], [-1.0, +1.0], [+1.0, +1.0]]
+        ),
+        pesos=np.ones((2, 2)),
+        tamanio_lote=1,
+        semilla=0,
+    )
+    print(f"Pesos finales (columna AND, columna OR):\n{pesos}")
+    print(f"Umbrales finales: {umbrales}")
+
+    # Clasificación uno contra el resto: cada clase es un prototipo con ruido
+    num_clases, caracteristicas = 200, 256
+    prototipos = rng.standard_normal((num_clases, caracteristicas), dtype=np.float32)
+    etiquetas = rng.integers(0, num_clases, size=50_000)
+    entradas = prototipos[etiquetas] + 0.5 * rng.standard_normal(
+        (etiquetas.shape[0], caracteristicas), dtype=np.float32
+    )
+    salidas = uno_contra_resto(etiquetas, num_clases).astype(np.float32)
+
+    for hilos in (None, 4):
+        inicio = perf_counter()
+        pesos, umbrales = entrenar_perceptron_multiple(
+            entradas, salidas, lim_iteraciones=5, hilos=hilos, semilla=0
+        )
+        tiempo = perf_counter() - inicio
+        aciertos = np.mean(predecir_clase(entradas, pesos, umbrales) == etiquetas)
+        print(
+            f"{num_clases} cabezas, hilos={hilos}: {tiempo:.2f} s, exactitud {aciertos:.2%}"
+        )
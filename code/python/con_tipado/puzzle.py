@@ -0,0 +1,141 @@
+from typing import Callable, Iterator
+
+# Cada casilla ocupa 4 bits, suficiente para el 8-puzzle (3x3) y el 15-puzzle (4x4)
+BITS = 4
+MASK = (1 << BITS) - 1
+
+
+def pack_board(board: list[list[int]]) -> int:
+    """
+    Empaqueta un tablero en un entero, 4 bits por casilla.
+
+    La casilla (0, 0) ocupa los bits menos significativos y el 0 representa el hueco.
+
+    Args:
+        board: Tablero cuadrado con fichas del 0 al n*n - 1
+
+    Returns:
+        Estado empaquetado
+    """
+    state = 0
+    for i, tile in enumerate(tile for row in board for tile in row):
+        state |= tile << (BITS * i)
+    return state
+
+
+def unpack_board(state: int, size: int = 3) -> list[list[int]]:
+    """
+    Desempaqueta un estado en un tablero.
+
+    Args:
+        state: Estado empaquetado con pack_board
+        size: Longitud del lado del tablero
+
+    Returns:
+        Tablero como lista de filas
+    """
+    return [
+        [(state >> (BITS * (row * size + col))) & MASK for col in range(size)]
+        for row in range(size)
+    ]
+
+
+def blank_index(state: int, size: int = 3) -> int:
+    """
+    Obtiene la posición del hueco en un estado.
+
+    Args:
+        state: Estado empaquetado
+        size: Longitud del lado del tablero
+
+    Returns:
+        Índice (fila * size + columna) del hueco
+    """
+    for i in range(size * size):
+        if (state >> (BITS * i)) & MASK == 0:
+            return i
+    raise ValueError("The board has no blank tile")
+
+
+def puzzle_successors(size: int = 3) -> Callable[[int], Iterator[int]]:
+    """
+    Crea el generador de sucesores de un puzzle deslizante de lado 'size'.
+
+    Los movimientos precalculados por posición del hueco se aplican con
+    operaciones de bits, sin construir tableros intermedios.
+
+    Args:
+        size: Longitud del lado del tablero (3 para el 8-puzzle, 4 para el 15-puzzle)
+
+    Returns:
+        Función estado -> estados alcanzables moviendo el hueco
+        (arriba, abajo, izquierda, derecha)
+    """
+    moves: list[list[int]] = []
+    for i in range(size * size):
+        row, col = divmod(i, size)
+        neighbors = []
+        if row > 0:
+            neighbors.append(i - size)
+        if row < size - 1:
+            neighbors.append(i + size)
+        if col > 0:
+            neighbors.append(i - 1)
+        if col < size - 1:
+            neighbors.append(i + 1)
+        moves.append(neighbors)
+
+    def successors(state: int) -> Iterator[int]:
+        blank = blank_index(state, size)
+        for j in moves[blank]:
+            tile = (state >> (BITS * j)) & MASK
+            # El hueco vale 0: basta con quitar la ficha de j y ponerla en blank
+            yield (state & ~(MASK << (BITS * j))) | (tile << (BITS * blank))
+
+    return successors
+
+
+def misplaced_tiles(state: int, goal: int, size: int = 3) -> int:
+    """
+    Cuenta las fichas fuera de lugar respecto al objetivo (sin contar el hueco).
+
+    Args:
+        state: Estado empaquetado
+        goal: Estado objetivo empaquetado
+        size: Longitud del lado del tablero
+
+    Returns:
+        Número de fichas mal colocadas
+    """
+    diff = 0
+    for i in range(size * size):
+        tile = (state >> (BITS * i)) & MASK
+        if tile != 0 and tile != (goal >> (BITS * i)) & MASK:
+            diff += 1
+    return diff
+
+
+def manhattan(state: int, goal: int, size: int = 3) -> int:
+    """
+    Suma de distancias Manhattan de cada ficha a su posición en el objetivo.
+
+    Args:
+        state: Estado empaquetado
+        goal: Estado objetivo empaquetado
+        size: Longitud del lado del tablero
+
+    Returns:
+        Distancia total, heurística admisible para A*
+    """
+    goal_pos = [0] * (size * size)
+    for i in range(size * size):
+        goal_pos[(goal >> (BITS * i)) & MASK] = i
+
+    total = 0
+    for i in range(size * size):
+        tile = (state >> (BITS * i)) & MASK
+        if tile != 0:
+            row, col = divmod(i, size)
+            goal_row, goal_col = divmod(goal_pos[tile], size)
+            total += abs(row - goal_row) + abs(col - goal_col)
+    return total
@@ -113,7 +113,7 @@ class Queue(Container):
 
         self._head = self._head._next
         if self._head:
-            self._head.prev = None
+            self._head._prev = None
         else:
             self._tail = None
 
@@ -217,7 +217,7 @@ class Stack(Container):
         value = self.__head.value
         self.__head = self.__head._next
         if self.__head:
-            self.__head.prev = None
+            self.__head._prev = None
         self.__len -= 1
         return value
 
@@ -9,8 +9,12 @@ class Node:
         value: El valor almacenado en el nodo.
         _next: Referencia al siguiente nodo en la estructura.
         _prev: Referencia al nodo anterior en la estructura.
+        label: Etiqueta opcional del nodo.
     """
 
+    # Atributos fijos, sin __dict__ por instancia
+    __slots__ = ("value", "_next", "_prev", "label")
+
     def __init__(self, value, next=None, prev=None, label=None) -> None:
         self.value = value
         self._next = next
@@ -34,9 +38,12 @@ class Vertex:
         value: El valor almacenado en el vértice.
         lvl: Nivel del vértice, si aplica.
         visited: Indica si el vértice ha sido visitado.
-        adjacencies: Lista de vértices adyacentes.
+        _adjacencies: Lista de vértices adyacentes.
+        label: Etiqueta opcional del vértice.
     """
 
+    __slots__ = ("value", "lvl", "visited", "_adjacencies", "label")
+
     def __init__(
         self,
         value,
@@ -83,3 +90,20 @@ class Vertex:
             if self.label is None
             else f"{self.label} {{ Value: {self.value} Lvl: {self.lvl} }}"
         )
+
+
+if __name__ == "__main__":
+    import tracemalloc
+
+    # Reporte de memoria por instancia
+    n = 100_000
+    for nombre, fabrica in (
+        ("Node", lambda i: Node(i)),
+        ("Vertex", lambda i: Vertex(i)),
+    ):
+        tracemalloc.start()
+        instancias = [fabrica(i) for i in range(n)]
+        actual, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(f"{nombre}: {actual / n:.1f} B por instancia")
+        del instancias